@@ -0,0 +1,85 @@
+"""server_side_timestamp_defaults
+
+Revision ID: 7c41d2e9a0b3
+Revises: ed539501eefd
+Create Date: 2026-10-16 17:05:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c41d2e9a0b3"
+down_revision: Union[str, Sequence[str], None] = "ed539501eefd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables created without server-side timestamp defaults
+TABLES_WITHOUT_DEFAULTS = ["fund_series", "fund_classes", "sec_reports"]
+
+# All tables with an updated_at column maintained by trigger
+TIMESTAMPED_TABLES = [
+    "fund_providers",
+    "fund_issuers",
+    "fund_series",
+    "fund_classes",
+    "sec_reports",
+    "security_mappings",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Let the database fill created_at/updated_at instead of the application
+    for table in TABLES_WITHOUT_DEFAULTS:
+        for column in ("created_at", "updated_at"):
+            op.alter_column(
+                table,
+                column,
+                server_default=sa.text("NOW()"),
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+            )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = NOW();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+    for table in TIMESTAMPED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_{table}_updated_at
+            BEFORE UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION set_updated_at()
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TIMESTAMPED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
+
+    for table in TABLES_WITHOUT_DEFAULTS:
+        for column in ("created_at", "updated_at"):
+            op.alter_column(
+                table,
+                column,
+                server_default=None,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+            )
@@ -0,0 +1,75 @@
+"""add_current_row_unique_indexes
+
+Revision ID: 9e2b5f81c6d4
+Revises: 7c41d2e9a0b3
+Create Date: 2026-10-16 17:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9e2b5f81c6d4"
+down_revision: Union[str, Sequence[str], None] = "7c41d2e9a0b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Key columns of the current-row unique index per table
+CURRENT_ROW_KEYS = {
+    "fund_series": "issuer_id, series_id",
+    "fund_classes": "class_id",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The old upsert could leave several current rows per key (e.g. a class
+    # current under two series); end all but the newest so the unique
+    # indexes can be built
+    for table, key in CURRENT_ROW_KEYS.items():
+        op.execute(
+            f"""
+            UPDATE {table}
+            SET is_current = false, end_date = NOW()
+            WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, row_number() OVER (
+                        PARTITION BY {key}
+                        ORDER BY effective_date DESC, id DESC
+                    ) AS version_rank
+                    FROM {table}
+                    WHERE is_current
+                ) ranked
+                WHERE version_rank > 1
+            )
+            """
+        )
+
+    # At most one current version per series/class. These are the conflict
+    # targets for the INSERT ... ON CONFLICT upserts in FundDataSCDService.
+    op.create_index(
+        "uq_fund_series_current",
+        "fund_series",
+        ["issuer_id", "series_id"],
+        unique=True,
+        postgresql_where=sa.text("is_current"),
+    )
+
+    op.create_index(
+        "uq_fund_classes_current",
+        "fund_classes",
+        ["class_id"],
+        unique=True,
+        postgresql_where=sa.text("is_current"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_fund_classes_current", table_name="fund_classes")
+    op.drop_index("uq_fund_series_current", table_name="fund_series")
@@ -0,0 +1,47 @@
+"""sec_reports_jsonb_columns
+
+Revision ID: 3f8a6c0d2b17
+Revises: 9e2b5f81c6d4
+Create Date: 2026-10-16 17:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f8a6c0d2b17"
+down_revision: Union[str, Sequence[str], None] = "9e2b5f81c6d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = ["file_paths", "report_metadata", "raw_data"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Store report JSON as binary JSONB instead of re-parsed json text
+    for column in JSON_COLUMNS:
+        op.alter_column(
+            "sec_reports",
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in JSON_COLUMNS:
+        op.alter_column(
+            "sec_reports",
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            postgresql_using=f"{column}::json",
+        )
@@ -0,0 +1,30 @@
+"""sec_reports_raw_data_external_storage
+
+Revision ID: b6d0e4a7f912
+Revises: 3f8a6c0d2b17
+Create Date: 2026-10-16 17:25:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b6d0e4a7f912"
+down_revision: Union[str, Sequence[str], None] = "3f8a6c0d2b17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep large raw_data payloads out of line and uncompressed, so reads that
+    # do not select the column skip them and reads that do avoid decompression.
+    # Applies to newly written values; existing rows keep their current storage.
+    op.execute("ALTER TABLE sec_reports ALTER COLUMN raw_data SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE sec_reports ALTER COLUMN raw_data SET STORAGE EXTENDED")
@@ -0,0 +1,53 @@
+"""add_numeric_sec_identifier_columns
+
+Revision ID: 5a9c3e7b1d20
+Revises: b6d0e4a7f912
+Create Date: 2026-10-16 17:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5a9c3e7b1d20"
+down_revision: Union[str, Sequence[str], None] = "b6d0e4a7f912"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Numeric part of the SEC identifier (S000004310 -> 4310) for integer index lookups
+    op.add_column("fund_series", sa.Column("series_num", sa.BigInteger(), nullable=True))
+    op.add_column("fund_classes", sa.Column("class_num", sa.BigInteger(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE fund_series
+        SET series_num = substring(series_id FROM 2)::bigint
+        WHERE series_id ~ '^S[0-9]{9,14}$'
+        """
+    )
+    op.execute(
+        """
+        UPDATE fund_classes
+        SET class_num = substring(class_id FROM 2)::bigint
+        WHERE class_id ~ '^C[0-9]{9,14}$'
+        """
+    )
+
+    op.create_index("ix_fund_series_series_num", "fund_series", ["series_num"])
+    op.create_index("ix_fund_classes_class_num", "fund_classes", ["class_num"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_fund_classes_class_num", table_name="fund_classes")
+    op.drop_index("ix_fund_series_series_num", table_name="fund_series")
+
+    op.drop_column("fund_classes", "class_num")
+    op.drop_column("fund_series", "series_num")
@@ -0,0 +1,62 @@
+"""security_mappings_identifier_type_enum
+
+Revision ID: e8f1a4c62b93
+Revises: 5a9c3e7b1d20
+Create Date: 2026-10-16 17:35:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8f1a4c62b93"
+down_revision: Union[str, Sequence[str], None] = "5a9c3e7b1d20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+identifier_type_enum = postgresql.ENUM("CUSIP", "ISIN", name="security_identifier_type")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The enum itself restricts the allowed values
+    op.drop_constraint(
+        "ck_security_mappings_identifier_type", "security_mappings", type_="check"
+    )
+
+    identifier_type_enum.create(op.get_bind(), checkfirst=True)
+
+    # Rewrites the table and rebuilds the indexes on identifier_type
+    op.alter_column(
+        "security_mappings",
+        "identifier_type",
+        type_=identifier_type_enum,
+        existing_type=sa.String(length=10),
+        existing_nullable=False,
+        postgresql_using="identifier_type::security_identifier_type",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "security_mappings",
+        "identifier_type",
+        type_=sa.String(length=10),
+        existing_type=identifier_type_enum,
+        existing_nullable=False,
+        postgresql_using="identifier_type::text",
+    )
+
+    identifier_type_enum.drop(op.get_bind(), checkfirst=True)
+
+    op.create_check_constraint(
+        "ck_security_mappings_identifier_type",
+        "security_mappings",
+        "identifier_type IN ('CUSIP', 'ISIN')",
+    )
@@ -0,0 +1,62 @@
+"""add_partial_indexes_for_hot_predicates
+
+Revision ID: 2d7b9f4e8a15
+Revises: e8f1a4c62b93
+Create Date: 2026-10-16 17:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2d7b9f4e8a15"
+down_revision: Union[str, Sequence[str], None] = "e8f1a4c62b93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Stale-mapping refresh scans only active mappings by fetch date
+    op.create_index(
+        "ix_security_mappings_stale",
+        "security_mappings",
+        ["last_fetched_date"],
+        postgresql_where=sa.text("end_date IS NULL"),
+    )
+    # Superseded by the partial index above; every query on fetch date only
+    # looks at active mappings
+    op.drop_index("idx_security_mappings_fetch_date", table_name="security_mappings")
+    # Active-mapping lookups are served by the unique idx_security_mappings_active,
+    # and nothing looks up ended mappings by identifier
+    op.drop_index(
+        "idx_security_mappings_current_lookup", table_name="security_mappings"
+    )
+
+    # Pending downloads, newest filing first; shrinks as reports are downloaded
+    op.create_index(
+        "ix_sec_reports_pending_download",
+        "sec_reports",
+        ["filing_date"],
+        postgresql_where=sa.text("download_status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_sec_reports_pending_download", table_name="sec_reports")
+    op.create_index(
+        "idx_security_mappings_current_lookup",
+        "security_mappings",
+        ["identifier_type", "identifier_value", "end_date"],
+    )
+    op.create_index(
+        "idx_security_mappings_fetch_date",
+        "security_mappings",
+        ["last_fetched_date"],
+    )
+    op.drop_index("ix_security_mappings_stale", table_name="security_mappings")
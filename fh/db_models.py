@@ -6,13 +6,95 @@ This module provides SQLModel-based database models and services for:
 - Fund provider and issuer management (CIK hierarchy)
 - Security mappings cache (CUSIP/ISIN to ticker mappings from OpenFIGI API)
 - SEC reports tracking (N-PORT, 13F, N-CSR, etc.)
+
+SEC series and class identifiers are a fixed letter prefix followed by 9-14
+digits (S000004310, C000219740). The string form is the lookup and upsert
+conflict key; the numeric part is also stored as a BIGINT (series_num/class_num)
+when the id is well formed. Rows written before those columns existed may not
+have it, so lookups do not rely on it.
 """
 
+import csv
+import functools
+import io
+import json
+import re
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
 from datetime import datetime, timedelta, date
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from loguru import logger
-from sqlmodel import Field, Session, SQLModel, create_engine, select, Column, JSON
+from sqlalchemy import (
+    BigInteger,
+    Enum,
+    Index,
+    String,
+    Text,
+    UniqueConstraint,
+    and_,
+    any_,
+    bindparam,
+    case,
+    cast,
+    column,
+    func,
+    insert,
+    literal,
+    or_,
+    text,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError, DisconnectionError
+from sqlalchemy.orm import defer, selectinload, sessionmaker
+from sqlmodel import (
+    JSON,
+    Column,
+    Field,
+    Relationship,
+    Session,
+    SQLModel,
+    create_engine,
+    select,
+)
+
+# SEC identifiers: prefix letter followed by 9-14 digits (e.g. S000004310, C000219740)
+_SERIES_RE = re.compile(r"S\d{9,14}")
+_CLASS_RE = re.compile(r"C\d{9,14}")
+
+
+def sec_id_number(identifier: str) -> int:
+    """Numeric part of a validated SEC series/class id (S000004310 -> 4310)."""
+    return int(identifier[1:])
+
+
+# Validated share class entry from the SEC API, flattened with its series id
+ClassRow = namedtuple("ClassRow", "series_id class_id class_name ticker")
+
+# Ticker columns of an active security mapping
+ActiveTicker = namedtuple("ActiveTicker", "ticker has_no_results")
+
+
+def server_now_field():
+    """Timestamp filled in by the database clock on insert."""
+    return Field(
+        default=None, nullable=False, sa_column_kwargs={"server_default": func.now()}
+    )
+
+
+def updated_at_field():
+    """Modification timestamp filled in by the database on insert and update."""
+    return Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
+    )
 
 
 # Fund Provider and Issuer Models
@@ -25,8 +107,8 @@ class FundProvider(SQLModel, table=True):
     provider_name: str = Field(max_length=100, index=True)
     display_name: Optional[str] = Field(max_length=100, default=None)
     is_active: bool = Field(default=True, index=True)
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: Optional[datetime] = server_now_field()
+    updated_at: Optional[datetime] = updated_at_field()
 
 
 class FundIssuer(SQLModel, table=True):
@@ -39,8 +121,8 @@ class FundIssuer(SQLModel, table=True):
     cik: str = Field(max_length=10, unique=True, index=True)
     company_name: str = Field(max_length=200, index=True)
     is_active: bool = Field(default=True, index=True)
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: Optional[datetime] = server_now_field()
+    updated_at: Optional[datetime] = updated_at_field()
 
 
 # Fund Series Models with Type 6 SCD
@@ -48,33 +130,71 @@ class FundSeries(SQLModel, table=True):
     """Database model for fund series with Type 6 SCD tracking."""
 
     __tablename__ = "fund_series"
+    __table_args__ = (
+        # One current version per series; conflict target for upserts
+        Index(
+            "uq_fund_series_current",
+            "issuer_id",
+            "series_id",
+            unique=True,
+            postgresql_where=text("is_current"),
+            sqlite_where=text("is_current"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     issuer_id: int = Field(foreign_key="fund_issuers.id", index=True)
     series_id: str = Field(max_length=100, index=True)  # e.g., S000004310
+    series_num: Optional[int] = Field(
+        default=None, sa_type=BigInteger, index=True
+    )  # e.g., 4310
 
     # Type 6 SCD fields
     is_current: bool = Field(default=True, index=True)
     effective_date: datetime = Field(index=True)
     end_date: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: Optional[datetime] = server_now_field()
+    updated_at: Optional[datetime] = updated_at_field()
 
     # Metadata
     source: str = Field(max_length=50, default="sec_api")
     last_verified_date: datetime = Field(default_factory=datetime.now)
 
+    # Class rows (all versions) sharing this series_id; joined on the natural
+    # key, so read-only. Must be loaded explicitly (e.g. selectinload).
+    classes: List["FundClass"] = Relationship(
+        back_populates="series",
+        sa_relationship_kwargs={
+            "primaryjoin": "FundSeries.series_id == foreign(FundClass.series_id)",
+            "viewonly": True,
+            "lazy": "raise",
+        },
+    )
+
 
 class FundClass(SQLModel, table=True):
     """Database model for fund classes with Type 6 SCD tracking."""
 
     __tablename__ = "fund_classes"
+    __table_args__ = (
+        # One current version per class; conflict target for upserts
+        Index(
+            "uq_fund_classes_current",
+            "class_id",
+            unique=True,
+            postgresql_where=text("is_current"),
+            sqlite_where=text("is_current"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     series_id: str = Field(
         max_length=100, index=True
     )  # References FundSeries.series_id
     class_id: str = Field(max_length=100, index=True)  # e.g., C000219740
+    class_num: Optional[int] = Field(
+        default=None, sa_type=BigInteger, index=True
+    )  # e.g., 219740
 
     # Class attributes that can change over time
     class_name: Optional[str] = Field(max_length=200, default=None)
@@ -84,43 +204,90 @@ class FundClass(SQLModel, table=True):
     is_current: bool = Field(default=True, index=True)
     effective_date: datetime = Field(index=True)
     end_date: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: Optional[datetime] = server_now_field()
+    updated_at: Optional[datetime] = updated_at_field()
 
     # Metadata and change tracking
     source: str = Field(max_length=50, default="sec_api")
     last_verified_date: datetime = Field(default_factory=datetime.now)
     change_reason: Optional[str] = Field(max_length=100, default=None)
 
+    # Current FundSeries row for this class; read-only, must be loaded explicitly
+    series: Optional[FundSeries] = Relationship(
+        back_populates="classes",
+        sa_relationship_kwargs={
+            "primaryjoin": "and_(foreign(FundClass.series_id) == FundSeries.series_id, "
+            "FundSeries.is_current == True)",
+            "viewonly": True,
+            "lazy": "raise",
+            "uselist": False,
+        },
+    )
+
 
 # SEC Reports Models
+
+# Binary JSONB on PostgreSQL (no re-parsing on read, GIN-indexable); plain JSON elsewhere
+JSONB_OR_JSON = JSON().with_variant(postgresql.JSONB(), "postgresql")
+
+
 class SECReport(SQLModel, table=True):
     """Database model for SEC reports filed by funds (N-PORT, 13F, N-CSR, etc.)."""
 
     __tablename__ = "sec_reports"
+    __table_args__ = (
+        # Conflict target for report upserts
+        UniqueConstraint(
+            "series_id",
+            "accession_number",
+            "form_type",
+            name="uq_sec_reports_series_accession_form",
+        ),
+        # Pending downloads, newest filing first
+        Index(
+            "ix_sec_reports_pending_download",
+            "filing_date",
+            postgresql_where=text("download_status = 'pending'"),
+            sqlite_where=text("download_status = 'pending'"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    series_id: str = Field(max_length=15, index=True)  # References fund_series.series_id (no FK due to Type 6 SCD)
+    series_id: str = Field(
+        max_length=15, index=True
+    )  # References fund_series.series_id (no FK due to Type 6 SCD)
     accession_number: str = Field(max_length=50, index=True)  # SEC accession number
 
     # Report identification
     form_type: str = Field(max_length=20, index=True)  # NPORT-P, 13F, N-CSR, etc.
     filing_date: Optional[date] = Field(default=None, index=True)  # Date filed with SEC
     report_date: Optional[date] = Field(default=None, index=True)  # Period end date
-    public_date: Optional[date] = Field(default=None)  # When data becomes public (N-PORT has 60-day delay)
+    public_date: Optional[date] = Field(
+        default=None
+    )  # When data becomes public (N-PORT has 60-day delay)
 
     # Processing status tracking
-    download_status: str = Field(max_length=20, default="pending", index=True)  # pending, downloaded, failed
-    processing_status: str = Field(max_length=20, default="pending", index=True)  # pending, processed, failed
+    download_status: str = Field(
+        max_length=20, default="pending", index=True
+    )  # pending, downloaded, failed
+    processing_status: str = Field(
+        max_length=20, default="pending", index=True
+    )  # pending, processed, failed
 
     # Flexible storage for different form types
-    file_paths: Optional[dict] = Field(default=None, sa_column=Column(JSON))  # {"xml": "path", "csv": "path", "txt": "path"}
-    report_metadata: Optional[dict] = Field(default=None, sa_column=Column(JSON))  # Form-specific metadata
-    raw_data: Optional[dict] = Field(default=None, sa_column=Column(JSON))  # Original parsed SEC data
+    file_paths: Optional[dict] = Field(
+        default=None, sa_column=Column(JSONB_OR_JSON)
+    )  # {"xml": "path", "csv": "path", "txt": "path"}
+    report_metadata: Optional[dict] = Field(
+        default=None, sa_column=Column(JSONB_OR_JSON)
+    )  # Form-specific metadata
+    raw_data: Optional[dict] = Field(
+        default=None, sa_column=Column(JSONB_OR_JSON)
+    )  # Original parsed SEC data
 
     # Standard tracking fields
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: Optional[datetime] = server_now_field()
+    updated_at: Optional[datetime] = updated_at_field()
     last_processed_at: Optional[datetime] = Field(default=None)
     error_message: Optional[str] = Field(default=None)
 
@@ -132,15 +299,131 @@ class SecurityMapping(SQLModel, table=True):
     __tablename__ = "security_mappings"
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    identifier_type: str = Field(max_length=10, index=True)
-    identifier_value: str = Field(max_length=50, index=True)
+    # Native enum on PostgreSQL: a 4-byte key in the lookup indexes instead of text
+    identifier_type: str = Field(
+        sa_type=Enum("CUSIP", "ISIN", name="security_identifier_type")
+    )
+    identifier_value: str = Field(max_length=50)
     ticker: Optional[str] = Field(default=None, max_length=20)
     has_no_results: bool = Field(default=False)
-    start_date: datetime = Field(default_factory=lambda: datetime.now())
+    start_date: Optional[datetime] = server_now_field()
     end_date: Optional[datetime] = Field(default=None)
-    last_fetched_date: datetime = Field(default_factory=lambda: datetime.now())
-    created_at: datetime = Field(default_factory=lambda: datetime.now())
-    updated_at: datetime = Field(default_factory=lambda: datetime.now())
+    last_fetched_date: Optional[datetime] = server_now_field()
+    created_at: Optional[datetime] = server_now_field()
+    updated_at: Optional[datetime] = updated_at_field()
+
+    __table_args__ = (
+        # One active mapping per identifier; conflict target for upserts
+        Index(
+            "idx_security_mappings_active",
+            "identifier_type",
+            "identifier_value",
+            unique=True,
+            postgresql_where=text("end_date IS NULL"),
+            sqlite_where=text("end_date IS NULL"),
+        ),
+        # Stale-mapping refresh over active mappings
+        Index(
+            "ix_security_mappings_stale",
+            "last_fetched_date",
+            postgresql_where=text("end_date IS NULL"),
+            sqlite_where=text("end_date IS NULL"),
+        ),
+    )
+
+
+# Prebuilt statements for hot lookups; values are supplied as bind parameters
+# at execution so the statement object (and its SQL cache key) is reused.
+_ACTIVE_MAPPING_STMT = (
+    select(SecurityMapping)
+    .where(
+        SecurityMapping.identifier_type == bindparam("identifier_type"),
+        SecurityMapping.identifier_value == bindparam("identifier_value"),
+        SecurityMapping.end_date.is_(None),
+    )
+    .limit(1)
+)
+
+_ACTIVE_TICKER_STMT = (
+    select(SecurityMapping.ticker, SecurityMapping.has_no_results)
+    .where(
+        SecurityMapping.identifier_type == bindparam("identifier_type"),
+        SecurityMapping.identifier_value == bindparam("identifier_value"),
+        SecurityMapping.end_date.is_(None),
+    )
+    .limit(1)
+)
+
+_CURRENT_SERIES_FOR_ISSUER_STMT = (
+    select(FundSeries)
+    .where(
+        FundSeries.issuer_id == bindparam("issuer_id"), FundSeries.is_current == True
+    )
+    .order_by(FundSeries.series_id)
+)
+
+_CURRENT_CLASSES_FOR_SERIES_STMT = (
+    select(FundClass)
+    .where(FundClass.series_id == bindparam("series_id"), FundClass.is_current == True)
+    .order_by(FundClass.class_id)
+)
+
+_LATEST_REPORT_BY_FORM_STMT = (
+    select(SECReport)
+    .where(
+        SECReport.series_id == bindparam("series_id"),
+        SECReport.form_type == bindparam("form_type"),
+    )
+    .order_by(SECReport.report_date.desc())
+    .limit(1)
+)
+
+_PENDING_DOWNLOADS_STMT = (
+    select(SECReport)
+    .where(SECReport.download_status == "pending")
+    .order_by(SECReport.filing_date.desc())
+)
+
+_PENDING_DOWNLOADS_BY_FORM_STMT = _PENDING_DOWNLOADS_STMT.where(
+    SECReport.form_type == bindparam("form_type")
+)
+
+# Loader options for status-only report listings: the JSON payloads are not
+# fetched, and touching them on a returned object raises instead of loading
+_SKIP_REPORT_PAYLOADS = (
+    defer(SECReport.report_metadata, raiseload=True),
+    defer(SECReport.raw_data, raiseload=True),
+)
+
+
+def retry_on_disconnect(func):
+    """
+    Retry a database operation once if its connection was dropped.
+
+    Pooled connections are not pinged on checkout, so a connection closed by
+    the server is only noticed when it is used. SQLAlchemy invalidates it and
+    the pool hands out a fresh one on the retry. Other errors, including
+    cancelled statements, are raised as is. Only apply this to reads.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except (DisconnectionError, DBAPIError) as e:
+            if isinstance(e, DBAPIError) and not e.connection_invalidated:
+                raise
+            logger.warning(
+                f"Database connection lost in {func.__name__}, retrying: {e}"
+            )
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+# Server-side cap for short lookups that opt in via get_session (PostgreSQL);
+# batch and ETL sessions run without one
+LOOKUP_STATEMENT_TIMEOUT_MS = 30_000
 
 
 class DatabaseManager:
@@ -149,19 +432,186 @@ class DatabaseManager:
     def __init__(self, database_url: str):
         """Initialize database manager with connection URL."""
         # Add connection pooling and performance settings
+        connect_args = {}
+        driver_kwargs = {}
+        url = make_url(database_url)
+        if url.get_backend_name() == "postgresql":
+            # TCP keepalives detect dead connections instead of a per-checkout ping
+            connect_args = {
+                "keepalives": 1,
+                "keepalives_idle": 30,
+                "keepalives_interval": 10,
+                "keepalives_count": 5,
+            }
+        if url.get_driver_name() == "psycopg2":
+            # Batch executemany INSERTs into multi-row VALUES pages and
+            # UPDATE/DELETE executemany into execute_batch round trips
+            driver_kwargs = {
+                "executemany_mode": "values_plus_batch",
+                "insertmanyvalues_page_size": 1000,
+            }
+
         self.engine = create_engine(
             database_url,
             pool_size=10,  # Number of connections to maintain
             max_overflow=20,  # Additional connections when needed
-            pool_pre_ping=True,  # Validate connections before use
-            pool_recycle=3600,  # Recycle connections after 1 hour
+            pool_pre_ping=False,  # Avoid a SELECT 1 round trip on every checkout
+            pool_recycle=1800,  # Recycle connections after 30 minutes
+            pool_use_lifo=True,  # Reuse the most recent connection; idle extras age out
+            connect_args=connect_args,
             echo=False,  # Set to True for SQL debugging
+            **driver_kwargs,
+        )
+        self.session_factory = sessionmaker(
+            self.engine, class_=Session, expire_on_commit=False, autoflush=False
         )
         # Note: We don't create tables here since we use Alembic migrations
 
-    def get_session(self) -> Session:
-        """Get a database session context manager."""
-        return Session(self.engine)
+    def get_session(self, statement_timeout_ms: Optional[int] = None) -> Session:
+        """
+        Get a database session context manager.
+
+        Sessions keep loaded attributes after commit (results are typically
+        returned to callers after the session closes) and do not autoflush;
+        code that needs pending changes visible to a query flushes explicitly.
+
+        Args:
+            statement_timeout_ms: Optional server-side statement timeout for the
+                session's first transaction (PostgreSQL only; ignored elsewhere)
+        """
+        session = self.session_factory()
+        if (
+            statement_timeout_ms is not None
+            and self.engine.dialect.name == "postgresql"
+        ):
+            # is_local=true scopes the setting to the transaction this begins
+            session.exec(
+                select(
+                    func.set_config(
+                        "statement_timeout", str(statement_timeout_ms), True
+                    )
+                )
+            )
+        return session
+
+    @contextmanager
+    def session_scope(self, session: Optional[Session] = None) -> Iterator[Session]:
+        """
+        Use a caller-supplied session, or open and close a new one.
+
+        Lets callers share one session (and one transaction) across several
+        service calls. A supplied session is neither committed nor closed here.
+
+        Args:
+            session: Optional session owned by the caller
+
+        Yields:
+            The session to use
+        """
+        if session is not None:
+            yield session
+            return
+        with self.get_session() as new_session:
+            yield new_session
+
+    def match_any(self, column, values: list, type_=String):
+        """
+        Build a membership filter for a list of values.
+
+        On PostgreSQL this renders ``column = ANY(:values)`` with a single array
+        bind, so the statement text is identical regardless of list length and
+        the server can reuse its plan. Other dialects fall back to ``IN (...)``.
+
+        Args:
+            column: Column to filter on
+            values: Values to match
+            type_: Element type of the array bind on PostgreSQL
+
+        Returns:
+            SQL expression usable in a ``where`` clause
+        """
+        if self.engine.dialect.name == "postgresql":
+            return column == any_(
+                bindparam(None, value=list(values), type_=postgresql.ARRAY(type_))
+            )
+        return column.in_(values)
+
+
+# Rows per INSERT ... ON CONFLICT statement (keeps bind parameters under driver limits)
+UPSERT_BATCH_SIZE = 1000
+
+# Changed classes at or above which the SCD diff runs as one UPDATE ... FROM
+# (VALUES ...) on PostgreSQL instead of a preload and compare in Python
+SET_BASED_SCD_MIN_ROWS = 100
+
+# Identifiers per IN/ANY lookup (SQLite caps bind parameters; large IN lists plan poorly)
+LOOKUP_BATCH_SIZE = 500
+
+
+def dialect_insert(session: Session, model):
+    """
+    Get an INSERT construct supporting ON CONFLICT for the session's dialect.
+
+    Args:
+        session: Active session (used to determine the dialect)
+        model: SQLModel table class to insert into
+
+    Returns:
+        Dialect-specific Insert construct
+    """
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(model)
+    return postgresql.insert(model)
+
+
+def _chunks(items: list, size: int):
+    """Yield successive slices of at most ``size`` items."""
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+# Sentinel distinguishing a cache miss from a cached None
+_MISSING = object()
+
+
+class _TTLCache:
+    """Thread-safe, size-bounded LRU cache whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.RLock()
+
+    def get(self, key, default=_MISSING):
+        """Return the cached value, or ``default`` if absent or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key) -> None:
+        """Drop a single entry if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
 
 
 class FundDataSCDService:
@@ -175,6 +625,10 @@ class FundDataSCDService:
         """
         Insert or update series data using Type 6 SCD approach with batch optimization.
 
+        New and unchanged rows are handled with INSERT ... ON CONFLICT against
+        the partial unique indexes on current rows; only classes whose name or
+        ticker changed are versioned in Python.
+
         Args:
             issuer_id: Fund issuer ID (from fund_issuers table)
             series_data: List of series data from SEC API
@@ -193,147 +647,152 @@ class FundDataSCDService:
         }
 
         current_time = datetime.now()
+        changed_log = []  # (class_id, change_reasons) for classes with SCD changes
 
         try:
             with self.db_manager.get_session() as session:
                 # Pre-validate and collect valid data
-                valid_series_ids = []
-                valid_class_data = []
-
-                for series in series_data:
-                    series_id = series.get("series_id")
-                    if not series_id:
-                        continue
-
-                    if self._is_valid_series_id(series_id):
-                        valid_series_ids.append(series_id)
-
-                        # Collect valid class data
-                        for class_data in series.get("classes", []):
-                            class_id = class_data.get("class_id")
-                            if class_id and self._is_valid_class_id(class_id):
-                                valid_class_data.append((series_id, class_data))
-                            elif class_id:
-                                logger.warning(
-                                    f"Skipping invalid class_id format: '{class_id}' (expected format: C000000000)"
-                                )
-                                stats["classes_skipped_invalid"] += 1
-                    else:
-                        logger.warning(
-                            f"Skipping invalid series_id format: '{series_id}' (expected format: S000000000)"
-                        )
-                        stats["series_skipped_invalid"] += 1
-
-                # Batch load existing series records
-                existing_series_map = {}
-                if valid_series_ids:
-                    existing_series_stmt = select(FundSeries).where(
-                        FundSeries.issuer_id == issuer_id,
-                        FundSeries.series_id.in_(valid_series_ids),
-                        FundSeries.is_current == True,
+                valid_series_ids, valid_class_data, invalid_series, invalid_classes = (
+                    self._validate_series_data(series_data)
+                )
+
+                for series_id in invalid_series:
+                    logger.warning(
+                        f"Skipping invalid series_id format: '{series_id}' (expected format: S000000000)"
                     )
-                    existing_series = session.exec(existing_series_stmt).all()
-                    existing_series_map = {s.series_id: s for s in existing_series}
-
-                # Batch load existing class records
-                existing_class_map = {}
-                if valid_class_data:
-                    class_ids = [
-                        class_data[1]["class_id"] for class_data in valid_class_data
-                    ]
-                    existing_class_stmt = select(FundClass).where(
-                        FundClass.class_id.in_(class_ids), FundClass.is_current == True
+                stats["series_skipped_invalid"] += len(invalid_series)
+
+                for class_id in invalid_classes:
+                    logger.warning(
+                        f"Skipping invalid class_id format: '{class_id}' (expected format: C000000000)"
                     )
-                    existing_classes = session.exec(existing_class_stmt).all()
-                    existing_class_map = {c.class_id: c for c in existing_classes}
+                stats["classes_skipped_invalid"] += len(invalid_classes)
 
-                # Process series records in batch
+                # Build upsert rows in one pass, deduplicating ids (first
+                # occurrence wins); a single upsert statement cannot touch the
+                # same conflict row twice
+                series_rows = {}
                 for series_id in valid_series_ids:
-                    if series_id in existing_series_map:
-                        # Update existing series
-                        existing_series = existing_series_map[series_id]
-                        existing_series.last_verified_date = current_time
-                        existing_series.updated_at = current_time
-                        session.add(existing_series)
-                        stats["series_verified"] += 1
+                    if series_id not in series_rows:
+                        series_rows[series_id] = {
+                            "issuer_id": issuer_id,
+                            "series_id": series_id,
+                            "series_num": sec_id_number(series_id),
+                            "is_current": True,
+                            "effective_date": current_time,
+                            "last_verified_date": current_time,
+                            "source": "sec_api",
+                        }
+
+                class_rows = {}
+                for row in valid_class_data:
+                    if row.class_id not in class_rows:
+                        class_rows[row.class_id] = {
+                            "series_id": row.series_id,
+                            "class_id": row.class_id,
+                            "class_num": sec_id_number(row.class_id),
+                            "class_name": row.class_name,
+                            "ticker": row.ticker,
+                            "is_current": True,
+                            "effective_date": current_time,
+                            "last_verified_date": current_time,
+                            "source": "sec_api",
+                            "change_reason": "new_record",
+                        }
+
+                # Series: insert new rows, refresh last_verified_date on existing ones
+                for batch in _chunks(list(series_rows.values()), UPSERT_BATCH_SIZE):
+                    stmt = dialect_insert(session, FundSeries).values(batch)
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=[FundSeries.issuer_id, FundSeries.series_id],
+                        index_where=FundSeries.is_current,
+                        set_={
+                            "last_verified_date": stmt.excluded.last_verified_date,
+                            "updated_at": func.now(),
+                        },
+                    ).returning(FundSeries.effective_date)
+
+                    for (effective_date,) in session.exec(stmt):
+                        if effective_date == current_time:
+                            stats["series_new"] += 1
+                        else:
+                            stats["series_verified"] += 1
+
+                # Classes: insert new rows and verify unchanged ones in the database.
+                # Rows whose series, name or ticker changed are left alone by the
+                # conflict clause, are not returned, and go through the SCD path below.
+                handled_class_ids = set()
+                for batch in _chunks(list(class_rows.values()), UPSERT_BATCH_SIZE):
+                    stmt = dialect_insert(session, FundClass).values(batch)
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=[FundClass.class_id],
+                        index_where=FundClass.is_current,
+                        set_={
+                            "last_verified_date": stmt.excluded.last_verified_date,
+                            "updated_at": func.now(),
+                        },
+                        where=and_(
+                            FundClass.series_id.is_not_distinct_from(
+                                stmt.excluded.series_id
+                            ),
+                            FundClass.class_name.is_not_distinct_from(
+                                stmt.excluded.class_name
+                            ),
+                            FundClass.ticker.is_not_distinct_from(stmt.excluded.ticker),
+                        ),
+                    ).returning(FundClass.class_id, FundClass.effective_date)
+
+                    for class_id, effective_date in session.exec(stmt):
+                        handled_class_ids.add(class_id)
+                        if effective_date == current_time:
+                            stats["classes_new"] += 1
+                        else:
+                            stats["classes_verified"] += 1
+
+                changed_class_ids = [
+                    class_id
+                    for class_id in class_rows
+                    if class_id not in handled_class_ids
+                ]
+                if changed_class_ids:
+                    # End the current records, then insert their replacements
+                    if (
+                        session.get_bind().dialect.name == "postgresql"
+                        and len(changed_class_ids) >= SET_BASED_SCD_MIN_ROWS
+                    ):
+                        ended = self._end_changed_classes_in_db(
+                            session, class_rows, changed_class_ids, current_time
+                        )
                     else:
-                        # Create new series
-                        new_series = FundSeries(
-                            issuer_id=issuer_id,
-                            series_id=series_id,
-                            effective_date=current_time,
-                            last_verified_date=current_time,
+                        ended = self._end_changed_classes(
+                            session, class_rows, changed_class_ids, current_time
                         )
-                        session.add(new_series)
-                        stats["series_new"] += 1
-
-                # Process class records in batch
-                for series_id, class_data in valid_class_data:
-                    class_id = class_data["class_id"]
-                    class_name = class_data.get("class_name")
-                    ticker = class_data.get("ticker")
-
-                    if class_id in existing_class_map:
-                        existing_class = existing_class_map[class_id]
 
-                        # Check if attributes have changed
-                        changed = False
+                    new_class_rows = []
+                    for class_id, old_series_id, old_name, old_ticker in ended:
+                        row = class_rows[class_id]
                         change_reasons = []
-
-                        if existing_class.class_name != class_name:
-                            changed = True
+                        if old_series_id != row["series_id"]:
                             change_reasons.append(
-                                f"name: '{existing_class.class_name}' → '{class_name}'"
+                                f"series: '{old_series_id}' → '{row['series_id']}'"
                             )
-
-                        if existing_class.ticker != ticker:
-                            changed = True
+                        if old_name != row["class_name"]:
                             change_reasons.append(
-                                f"ticker: '{existing_class.ticker}' → '{ticker}'"
+                                f"name: '{old_name}' → '{row['class_name']}'"
                             )
-
-                        if changed:
-                            # End the current record
-                            existing_class.is_current = False
-                            existing_class.end_date = current_time
-                            existing_class.updated_at = current_time
-                            session.add(existing_class)
-
-                            # Create new current record
-                            new_class = FundClass(
-                                series_id=series_id,
-                                class_id=class_id,
-                                class_name=class_name,
-                                ticker=ticker,
-                                effective_date=current_time,
-                                last_verified_date=current_time,
-                                change_reason="; ".join(change_reasons),
+                        if old_ticker != row["ticker"]:
+                            change_reasons.append(
+                                f"ticker: '{old_ticker}' → '{row['ticker']}'"
                             )
-                            session.add(new_class)
-                            stats["classes_updated"] += 1
 
-                            logger.info(
-                                f"Class {class_id} updated: {'; '.join(change_reasons)}"
-                            )
-                        else:
-                            # No changes - just update verification date
-                            existing_class.last_verified_date = current_time
-                            existing_class.updated_at = current_time
-                            session.add(existing_class)
-                            stats["classes_verified"] += 1
-                    else:
-                        # New class record
-                        new_class = FundClass(
-                            series_id=series_id,
-                            class_id=class_id,
-                            class_name=class_name,
-                            ticker=ticker,
-                            effective_date=current_time,
-                            last_verified_date=current_time,
-                            change_reason="new_record",
+                        new_class_rows.append(
+                            {**row, "change_reason": "; ".join(change_reasons)}
                         )
-                        session.add(new_class)
-                        stats["classes_new"] += 1
+                        stats["classes_updated"] += 1
+                        changed_log.append((class_id, change_reasons))
+
+                    for batch in _chunks(new_class_rows, UPSERT_BATCH_SIZE):
+                        session.exec(insert(FundClass).values(batch))
 
                 # Single commit for all operations
                 session.commit()
@@ -342,195 +801,241 @@ class FundDataSCDService:
             logger.error(f"Failed to upsert series data for issuer {issuer_id}: {e}")
             raise
 
+        # Log class changes once per batch rather than once per class
+        if changed_log:
+            logger.bind(issuer_id=issuer_id).info(
+                "classes_updated count={} sample={}", len(changed_log), changed_log[:10]
+            )
+            logger.opt(lazy=True).debug(
+                "classes_updated details={}",
+                lambda: json.dumps(changed_log, ensure_ascii=False),
+            )
+
         return stats
 
-    def _is_valid_series_id(self, series_id: str) -> bool:
+    def _end_changed_classes(
+        self,
+        session: Session,
+        class_rows: dict,
+        class_ids: List[str],
+        current_time: datetime,
+    ) -> List[Tuple[str, str, Optional[str], Optional[str]]]:
         """
-        Validate if a series_id looks like a proper SEC series identifier.
+        End current class rows whose series, name or ticker differs from the
+        incoming row.
+
+        Loads the current versions, compares them in Python and ends the changed
+        ones by primary key.
 
         Args:
-            series_id: Series ID to validate
+            session: Open session; the caller commits
+            class_rows: Incoming upsert rows keyed by class_id
+            class_ids: Class ids to check
+            current_time: End date for the superseded rows
 
         Returns:
-            True if looks valid, False otherwise
+            List of (class_id, old series_id, old class_name, old ticker) for
+            each ended row
         """
-        if not series_id or not isinstance(series_id, str):
-            return False
-
-        # Valid series IDs typically start with 'S' followed by 9-10 digits
-        # Example: S000004310
-        if series_id.startswith("S") and len(series_id) >= 10 and len(series_id) <= 15:
-            # Check if the part after 'S' is numeric
-            numeric_part = series_id[1:]
-            return numeric_part.isdigit()
+        # (series_id, class_name, ticker, id) of the current version, without
+        # ORM rows
+        existing_class_tuples = {}
+        # Keyed on class_id like the conflict target: class_num is not set on
+        # every row
+        for chunk in _chunks(class_ids, LOOKUP_BATCH_SIZE):
+            existing_class_tuples.update(
+                (class_id, (series_id, class_name, ticker, row_id))
+                for class_id, series_id, class_name, ticker, row_id in session.exec(
+                    select(
+                        FundClass.class_id,
+                        FundClass.series_id,
+                        FundClass.class_name,
+                        FundClass.ticker,
+                        FundClass.id,
+                    ).where(
+                        self.db_manager.match_any(FundClass.class_id, chunk),
+                        FundClass.is_current == True,
+                    )
+                )
+            )
 
-        return False
+        ended = []
+        ended_ids = []
+        for class_id, current in existing_class_tuples.items():
+            series_id, class_name, ticker, row_id = current
+            row = class_rows[class_id]
+            if (series_id, class_name, ticker) == (
+                row["series_id"],
+                row["class_name"],
+                row["ticker"],
+            ):
+                continue
+            ended.append((class_id, series_id, class_name, ticker))
+            ended_ids.append(row_id)
+
+        for chunk in _chunks(ended_ids, LOOKUP_BATCH_SIZE):
+            session.exec(
+                update(FundClass)
+                .where(FundClass.id.in_(chunk))
+                .values(is_current=False, end_date=current_time)
+            )
+        return ended
 
-    def _is_valid_class_id(self, class_id: str) -> bool:
+    def _end_changed_classes_in_db(
+        self,
+        session: Session,
+        class_rows: dict,
+        class_ids: List[str],
+        current_time: datetime,
+    ) -> List[Tuple[str, str, Optional[str], Optional[str]]]:
         """
-        Validate if a class_id looks like a proper SEC class identifier.
+        End changed class rows with a set-based UPDATE ... FROM (VALUES ...).
+
+        The incoming rows are staged as a VALUES list and joined against the
+        current versions, so the comparison runs in the database and only the
+        ended rows come back. PostgreSQL only.
 
         Args:
-            class_id: Class ID to validate
+            session: Open session; the caller commits
+            class_rows: Incoming upsert rows keyed by class_id
+            class_ids: Class ids to check
+            current_time: End date for the superseded rows
 
         Returns:
-            True if looks valid, False otherwise
+            List of (class_id, old series_id, old class_name, old ticker) for
+            each ended row
         """
-        if not class_id or not isinstance(class_id, str):
-            return False
-
-        # Valid class IDs typically start with 'C' followed by 9-10 digits
-        # Example: C000219740
-        if class_id.startswith("C") and len(class_id) >= 10 and len(class_id) <= 15:
-            # Check if the part after 'C' is numeric
-            numeric_part = class_id[1:]
-            return numeric_part.isdigit()
-
-        return False
-
-    def _upsert_series_record(
-        self,
-        session: Session,
-        issuer_id: int,
-        series_id: str,
-        current_time: datetime,
-        stats: dict,
-    ):
-        """Upsert a single series record."""
-        # Validate series_id format
-        if not self._is_valid_series_id(series_id):
-            logger.warning(
-                f"Skipping invalid series_id format: '{series_id}' (expected format: S000000000)"
-            )
-            stats["series_skipped_invalid"] += 1
-            return
-
-        # Check if current record exists
-        existing_series = session.exec(
-            select(FundSeries).where(
-                FundSeries.issuer_id == issuer_id,
-                FundSeries.series_id == series_id,
-                FundSeries.is_current == True,
+        ended = []
+        for chunk in _chunks(class_ids, UPSERT_BATCH_SIZE):
+            stage = values(
+                column("class_id", String),
+                column("series_id", String),
+                column("class_name", String),
+                column("ticker", String),
+                name="stage",
+            ).data(
+                [
+                    (
+                        class_id,
+                        class_rows[class_id]["series_id"],
+                        class_rows[class_id]["class_name"],
+                        class_rows[class_id]["ticker"],
+                    )
+                    for class_id in chunk
+                ]
             )
-        ).first()
-
-        if existing_series:
-            # Series exists - just update last_verified_date
-            existing_series.last_verified_date = current_time
-            existing_series.updated_at = current_time
-            session.add(existing_series)
-            stats["series_verified"] += 1
-        else:
-            # New series - create record
-            new_series = FundSeries(
-                issuer_id=issuer_id,
-                series_id=series_id,
-                effective_date=current_time,
-                last_verified_date=current_time,
+            stmt = (
+                update(FundClass)
+                .where(
+                    FundClass.class_id == stage.c.class_id,
+                    FundClass.is_current == True,
+                    or_(
+                        FundClass.series_id.is_distinct_from(stage.c.series_id),
+                        FundClass.class_name.is_distinct_from(stage.c.class_name),
+                        FundClass.ticker.is_distinct_from(stage.c.ticker),
+                    ),
+                )
+                .values(is_current=False, end_date=current_time)
+                # Series/name/ticker are not assigned, so these are the
+                # pre-update values
+                .returning(
+                    FundClass.class_id,
+                    FundClass.series_id,
+                    FundClass.class_name,
+                    FundClass.ticker,
+                )
             )
-            session.add(new_series)
-            stats["series_new"] += 1
+            ended.extend(tuple(row) for row in session.exec(stmt))
+        return ended
 
-    def _upsert_class_record(
-        self,
-        session: Session,
-        series_id: str,
-        class_data: dict,
-        current_time: datetime,
-        stats: dict,
-    ):
-        """Upsert a single class record with Type 6 SCD logic."""
-        class_id = class_data["class_id"]
-        class_name = class_data.get("class_name")
-        ticker = class_data.get("ticker")
-
-        # Validate class_id format
-        if not self._is_valid_class_id(class_id):
-            logger.warning(
-                f"Skipping invalid class_id format: '{class_id}' (expected format: C000000000)"
-            )
-            stats["classes_skipped_invalid"] += 1
-            return
+    def _validate_series_data(
+        self, series_data: List[dict]
+    ) -> Tuple[List[str], List[ClassRow], List[str], List[str]]:
+        """
+        Flatten nested series/class data and validate identifiers in one pass.
 
-        # Validate series_id format (should have been validated earlier, but double-check)
-        if not self._is_valid_series_id(series_id):
-            logger.warning(
-                f"Skipping class {class_id} - invalid series_id: '{series_id}'"
-            )
-            stats["classes_skipped_invalid"] += 1
-            return
+        Classes belonging to invalid series are dropped without being counted,
+        and entries with a missing identifier are ignored.
 
-        # Get current record
-        existing_class = session.exec(
-            select(FundClass).where(
-                FundClass.series_id == series_id,
-                FundClass.class_id == class_id,
-                FundClass.is_current == True,
-            )
-        ).first()
+        Args:
+            series_data: List of series data from SEC API
 
-        if existing_class:
-            # Check if attributes have changed
-            changed = False
-            change_reasons = []
+        Returns:
+            Tuple of (valid series IDs, valid ClassRow entries, invalid
+            series IDs, invalid class IDs)
+        """
+        series_match = _SERIES_RE.fullmatch
+        class_match = _CLASS_RE.fullmatch
+
+        valid_series = []
+        valid_classes = []
+        invalid_series = []
+        invalid_classes = []
+        for series in series_data:
+            series_id = series.get("series_id")
+            if not series_id:
+                continue
+            if not (isinstance(series_id, str) and series_match(series_id)):
+                invalid_series.append(series_id)
+                continue
+            valid_series.append(series_id)
+
+            for class_data in series.get("classes", []):
+                class_id = class_data.get("class_id")
+                if not class_id:
+                    continue
+                if isinstance(class_id, str) and class_match(class_id):
+                    valid_classes.append(
+                        ClassRow(
+                            series_id,
+                            class_id,
+                            class_data.get("class_name"),
+                            class_data.get("ticker"),
+                        )
+                    )
+                else:
+                    invalid_classes.append(class_id)
 
-            if existing_class.class_name != class_name:
-                changed = True
-                change_reasons.append(
-                    f"name: '{existing_class.class_name}' → '{class_name}'"
-                )
+        return valid_series, valid_classes, invalid_series, invalid_classes
 
-            if existing_class.ticker != ticker:
-                changed = True
-                change_reasons.append(f"ticker: '{existing_class.ticker}' → '{ticker}'")
-
-            if changed:
-                # End the current record
-                existing_class.is_current = False
-                existing_class.end_date = current_time
-                existing_class.updated_at = current_time
-                session.add(existing_class)
-
-                # Create new current record
-                new_class = FundClass(
-                    series_id=series_id,
-                    class_id=class_id,
-                    class_name=class_name,
-                    ticker=ticker,
-                    effective_date=current_time,
-                    last_verified_date=current_time,
-                    change_reason="; ".join(change_reasons),
-                )
-                session.add(new_class)
-                stats["classes_updated"] += 1
+    def get_current_series_for_issuer(self, issuer_id: int) -> List[FundSeries]:
+        """Get all current series for an issuer."""
+        try:
+            return self._select_current_series_for_issuer(issuer_id)
+        except Exception as e:
+            logger.error(f"Failed to get current series for issuer {issuer_id}: {e}")
+            return []
 
-                logger.info(f"Class {class_id} updated: {'; '.join(change_reasons)}")
-            else:
-                # No changes - just update verification date
-                existing_class.last_verified_date = current_time
-                existing_class.updated_at = current_time
-                session.add(existing_class)
-                stats["classes_verified"] += 1
-        else:
-            # New class record
-            new_class = FundClass(
-                series_id=series_id,
-                class_id=class_id,
-                class_name=class_name,
-                ticker=ticker,
-                effective_date=current_time,
-                last_verified_date=current_time,
-                change_reason="new_record",
+    @retry_on_disconnect
+    def _select_current_series_for_issuer(self, issuer_id: int) -> List[FundSeries]:
+        """Query the current series rows for an issuer."""
+        with self.db_manager.get_session() as session:
+            return list(
+                session.exec(
+                    _CURRENT_SERIES_FOR_ISSUER_STMT, params={"issuer_id": issuer_id}
+                ).all()
             )
-            session.add(new_class)
-            stats["classes_new"] += 1
 
-    def get_current_series_for_issuer(self, issuer_id: int) -> List[FundSeries]:
-        """Get all current series for an issuer."""
+    def get_current_classes_for_series(self, series_id: str) -> List[FundClass]:
+        """Get all current classes for a series."""
+        try:
+            with self.db_manager.get_session() as session:
+                return list(
+                    session.exec(
+                        _CURRENT_CLASSES_FOR_SERIES_STMT,
+                        params={"series_id": series_id},
+                    ).all()
+                )
+        except Exception as e:
+            logger.error(f"Failed to get current classes for series {series_id}: {e}")
+            return []
+
+    def list_current_series_ids(self, issuer_id: int) -> List[str]:
+        """Get current series IDs for an issuer without loading full rows."""
         try:
             with self.db_manager.get_session() as session:
                 statement = (
-                    select(FundSeries)
+                    select(FundSeries.series_id)
                     .where(
                         FundSeries.issuer_id == issuer_id, FundSeries.is_current == True
                     )
@@ -539,32 +1044,39 @@ class FundDataSCDService:
 
                 return list(session.exec(statement).all())
         except Exception as e:
-            logger.error(f"Failed to get current series for issuer {issuer_id}: {e}")
+            logger.error(
+                f"Failed to list current series IDs for issuer {issuer_id}: {e}"
+            )
             return []
 
-    def get_current_classes_for_series(self, series_id: str) -> List[FundClass]:
-        """Get all current classes for a series."""
+    def list_current_class_tickers(
+        self, series_id: str
+    ) -> List[Tuple[str, Optional[str]]]:
+        """Get (class_id, ticker) pairs for a series' current classes."""
         try:
             with self.db_manager.get_session() as session:
                 statement = (
-                    select(FundClass)
+                    select(FundClass.class_id, FundClass.ticker)
                     .where(
                         FundClass.series_id == series_id, FundClass.is_current == True
                     )
                     .order_by(FundClass.class_id)
                 )
 
-                return list(session.exec(statement).all())
+                return [tuple(row) for row in session.exec(statement).all()]
         except Exception as e:
-            logger.error(f"Failed to get current classes for series {series_id}: {e}")
+            logger.error(
+                f"Failed to list current class tickers for series {series_id}: {e}"
+            )
             return []
 
     def get_class_history(self, class_id: str) -> List[FundClass]:
-        """Get full history for a class ID."""
+        """Get full history for a class ID, with each row's current series loaded."""
         try:
             with self.db_manager.get_session() as session:
                 statement = (
                     select(FundClass)
+                    .options(selectinload(FundClass.series))
                     .where(FundClass.class_id == class_id)
                     .order_by(FundClass.effective_date)
                 )
@@ -578,26 +1090,23 @@ class FundDataSCDService:
         """Get statistics about series/class data."""
         try:
             with self.db_manager.get_session() as session:
-                # Count current records
-                series_count = len(
-                    list(
-                        session.exec(
-                            select(FundSeries).where(FundSeries.is_current == True)
-                        ).all()
+                # Count current and total historical records in one round trip
+                def count_rows(model, *criteria):
+                    return (
+                        select(func.count())
+                        .select_from(model)
+                        .where(*criteria)
+                        .scalar_subquery()
                     )
-                )
 
-                classes_count = len(
-                    list(
-                        session.exec(
-                            select(FundClass).where(FundClass.is_current == True)
-                        ).all()
+                series_count, classes_count, total_series, total_classes = session.exec(
+                    select(
+                        count_rows(FundSeries, FundSeries.is_current == True),
+                        count_rows(FundClass, FundClass.is_current == True),
+                        count_rows(FundSeries),
+                        count_rows(FundClass),
                     )
-                )
-
-                # Count total historical records
-                total_series = len(list(session.exec(select(FundSeries)).all()))
-                total_classes = len(list(session.exec(select(FundClass)).all()))
+                ).one()
 
                 return {
                     "current_series": series_count,
@@ -620,12 +1129,22 @@ class FundDataSCDService:
             return {}
 
 
+# In-process cache of active ticker lookups (including misses)
+ACTIVE_MAPPING_CACHE_SIZE = 50_000
+ACTIVE_MAPPING_CACHE_TTL = 300  # seconds
+
+
 class SecurityMappingService:
     """Service for CRUD operations on security mappings."""
 
     def __init__(self, db_manager: DatabaseManager):
         """Initialize service with database manager."""
         self.db_manager = db_manager
+        # (identifier_type, identifier_value) -> ActiveTicker or None; writes
+        # through this service update or drop the affected keys
+        self._active_cache = _TTLCache(
+            ACTIVE_MAPPING_CACHE_SIZE, ACTIVE_MAPPING_CACHE_TTL
+        )
 
     def get_active_mapping(
         self, identifier_type: str, identifier_value: str
@@ -641,19 +1160,141 @@ class SecurityMappingService:
             SecurityMapping if found and active, None otherwise
         """
         try:
-            with self.db_manager.get_session() as session:
-                statement = select(SecurityMapping).where(
-                    SecurityMapping.identifier_type == identifier_type,
-                    SecurityMapping.identifier_value == identifier_value,
-                    SecurityMapping.end_date.is_(None),
-                )
-                return session.exec(statement).first()
+            return self._select_active_mapping(identifier_type, identifier_value)
         except Exception as e:
             logger.warning(
                 f"Failed to get active mapping for {identifier_type} {identifier_value}: {e}"
             )
             return None
 
+    def get_active_ticker(
+        self, identifier_type: str, identifier_value: str
+    ) -> Optional[ActiveTicker]:
+        """
+        Get the cached ticker result for an identifier without loading a full row.
+
+        Fast path for ticker lookups: selects only the two columns callers
+        need and serves repeats from the in-process cache.
+
+        Args:
+            identifier_type: 'CUSIP' or 'ISIN'
+            identifier_value: The identifier value
+
+        Returns:
+            ActiveTicker(ticker, has_no_results) if an active mapping exists,
+            None otherwise
+        """
+        key = (identifier_type, identifier_value)
+        cached = self._active_cache.get(key)
+        if cached is not _MISSING:
+            return cached
+
+        try:
+            result = self._select_active_ticker(identifier_type, identifier_value)
+            self._active_cache.set(key, result)
+            return result
+        except Exception as e:
+            logger.warning(
+                f"Failed to get active ticker for {identifier_type} {identifier_value}: {e}"
+            )
+            return None
+
+    def get_active_tickers(
+        self, identifier_type: str, identifier_values: List[str]
+    ) -> Dict[str, Optional[ActiveTicker]]:
+        """
+        Get cached ticker results for many identifiers of one type.
+
+        Serves what it can from the in-process cache and fetches the rest
+        with one ANY/IN query per LOOKUP_BATCH_SIZE identifiers.
+
+        Args:
+            identifier_type: 'CUSIP' or 'ISIN'
+            identifier_values: Identifier values to look up
+
+        Returns:
+            Dictionary mapping each identifier to ActiveTicker(ticker,
+            has_no_results), or None if it has no active mapping. Identifiers
+            whose lookup failed are left out.
+        """
+        results = {}
+        to_query = []
+        for identifier_value in dict.fromkeys(identifier_values):
+            cached = self._active_cache.get((identifier_type, identifier_value))
+            if cached is _MISSING:
+                to_query.append(identifier_value)
+            else:
+                results[identifier_value] = cached
+
+        for chunk in _chunks(to_query, LOOKUP_BATCH_SIZE):
+            try:
+                found = self._select_active_tickers(identifier_type, chunk)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to get active tickers for {len(chunk)} {identifier_type} identifiers: {e}"
+                )
+                continue
+
+            for identifier_value in chunk:
+                result = found.get(identifier_value)
+                self._active_cache.set((identifier_type, identifier_value), result)
+                results[identifier_value] = result
+
+        return results
+
+    @retry_on_disconnect
+    def _select_active_mapping(
+        self, identifier_type: str, identifier_value: str
+    ) -> Optional[SecurityMapping]:
+        """Query the active mapping for an identifier."""
+        with self.db_manager.get_session(LOOKUP_STATEMENT_TIMEOUT_MS) as session:
+            return session.exec(
+                _ACTIVE_MAPPING_STMT,
+                params={
+                    "identifier_type": identifier_type,
+                    "identifier_value": identifier_value,
+                },
+            ).first()
+
+    @retry_on_disconnect
+    def _select_active_ticker(
+        self, identifier_type: str, identifier_value: str
+    ) -> Optional[ActiveTicker]:
+        """Query the ticker columns of the active mapping for an identifier."""
+        with self.db_manager.get_session(LOOKUP_STATEMENT_TIMEOUT_MS) as session:
+            row = session.exec(
+                _ACTIVE_TICKER_STMT,
+                params={
+                    "identifier_type": identifier_type,
+                    "identifier_value": identifier_value,
+                },
+            ).first()
+            return ActiveTicker(*row) if row is not None else None
+
+    @retry_on_disconnect
+    def _select_active_tickers(
+        self, identifier_type: str, identifier_values: List[str]
+    ) -> Dict[str, ActiveTicker]:
+        """Query the ticker columns of the active mappings for many identifiers."""
+        with self.db_manager.get_session(LOOKUP_STATEMENT_TIMEOUT_MS) as session:
+            rows = session.exec(
+                select(
+                    SecurityMapping.identifier_value,
+                    SecurityMapping.ticker,
+                    SecurityMapping.has_no_results,
+                ).where(
+                    SecurityMapping.identifier_type == identifier_type,
+                    self.db_manager.match_any(
+                        SecurityMapping.identifier_value, identifier_values
+                    ),
+                    SecurityMapping.end_date.is_(None),
+                )
+            )
+            return {
+                identifier_value: ActiveTicker(ticker, has_no_results)
+                for identifier_value, ticker, has_no_results in rows
+            }
+
     def create_or_update_mapping(
         self,
         identifier_type: str,
@@ -673,31 +1314,37 @@ class SecurityMappingService:
         Returns:
             SecurityMapping if successful, None if failed
         """
+        key = (identifier_type, identifier_value)
+        self._active_cache.pop(key)
         try:
             with self.db_manager.get_session() as session:
-                # Check if active mapping exists
-                existing = self.get_active_mapping(identifier_type, identifier_value)
-
-                if existing:
-                    # Update existing mapping
-                    existing.ticker = ticker
-                    existing.has_no_results = has_no_results
-                    existing.last_fetched_date = datetime.now()
-                    existing.updated_at = datetime.now()
-                    session.add(existing)
-                    mapping = existing
-                else:
-                    # Create new mapping
-                    mapping = SecurityMapping(
-                        identifier_type=identifier_type,
-                        identifier_value=identifier_value,
-                        ticker=ticker,
-                        has_no_results=has_no_results,
-                    )
-                    session.add(mapping)
-
+                # Insert, or update the active mapping in place, in one statement;
+                # start_date/last_fetched_date come from the database clock
+                stmt = dialect_insert(session, SecurityMapping).values(
+                    identifier_type=identifier_type,
+                    identifier_value=identifier_value,
+                    ticker=ticker,
+                    has_no_results=has_no_results,
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[
+                        SecurityMapping.identifier_type,
+                        SecurityMapping.identifier_value,
+                    ],
+                    index_where=SecurityMapping.end_date.is_(None),
+                    set_={
+                        "ticker": stmt.excluded.ticker,
+                        "has_no_results": stmt.excluded.has_no_results,
+                        "last_fetched_date": func.now(),
+                        "updated_at": func.now(),
+                    },
+                ).returning(SecurityMapping)
+
+                mapping = session.exec(stmt).scalar_one()
                 session.commit()
-                session.refresh(mapping)
+                self._active_cache.set(
+                    key, ActiveTicker(mapping.ticker, mapping.has_no_results)
+                )
                 return mapping
 
         except Exception as e:
@@ -706,6 +1353,153 @@ class SecurityMappingService:
             )
             return None
 
+    def create_or_update_mappings(self, mappings: List[dict]) -> int:
+        """
+        Create or update many mappings in one session and transaction.
+
+        Args:
+            mappings: List of dicts with identifier_type, identifier_value,
+                ticker and has_no_results keys
+
+        Returns:
+            Number of mappings written, 0 if failed
+        """
+        if not mappings:
+            return 0
+
+        # Last write wins for repeated identifiers within the batch
+        rows = {}
+        for mapping in mappings:
+            key = (mapping["identifier_type"], mapping["identifier_value"])
+            rows[key] = {
+                "identifier_type": mapping["identifier_type"],
+                "identifier_value": mapping["identifier_value"],
+                "ticker": mapping.get("ticker"),
+                "has_no_results": mapping.get("has_no_results", False),
+            }
+
+        for key in rows:
+            self._active_cache.pop(key)
+
+        try:
+            with self.db_manager.get_session() as session:
+                for batch in _chunks(list(rows.values()), UPSERT_BATCH_SIZE):
+                    stmt = dialect_insert(session, SecurityMapping).values(batch)
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=[
+                            SecurityMapping.identifier_type,
+                            SecurityMapping.identifier_value,
+                        ],
+                        index_where=SecurityMapping.end_date.is_(None),
+                        set_={
+                            "ticker": stmt.excluded.ticker,
+                            "has_no_results": stmt.excluded.has_no_results,
+                            "last_fetched_date": func.now(),
+                            "updated_at": func.now(),
+                        },
+                    )
+                    session.exec(stmt)
+
+                session.commit()
+                return len(rows)
+
+        except Exception as e:
+            logger.warning(f"Failed to create/update {len(rows)} mappings: {e}")
+            return 0
+
+    def bulk_import(self, mappings: Iterable[dict]) -> int:
+        """
+        Insert many new mappings, skipping identifiers that already have one.
+
+        Intended for seeding or backfilling the cache. On PostgreSQL the rows
+        are streamed with COPY into a temporary table and moved over with one
+        INSERT ... SELECT ... ON CONFLICT DO NOTHING; other databases use
+        batched multi-row inserts. Existing active mappings are not changed.
+
+        Args:
+            mappings: Iterable of dicts with identifier_type, identifier_value,
+                and optional ticker and has_no_results keys
+
+        Returns:
+            Number of mappings inserted, 0 if failed
+        """
+        try:
+            with self.db_manager.get_session() as session:
+                if session.get_bind().dialect.name == "postgresql":
+                    inserted = self._copy_import(session, mappings)
+                else:
+                    inserted = 0
+                    rows = [
+                        {
+                            "identifier_type": m["identifier_type"],
+                            "identifier_value": m["identifier_value"],
+                            "ticker": m.get("ticker"),
+                            "has_no_results": m.get("has_no_results", False),
+                        }
+                        for m in mappings
+                    ]
+                    for batch in _chunks(rows, UPSERT_BATCH_SIZE):
+                        stmt = dialect_insert(session, SecurityMapping).values(batch)
+                        stmt = stmt.on_conflict_do_nothing(
+                            index_elements=[
+                                SecurityMapping.identifier_type,
+                                SecurityMapping.identifier_value,
+                            ],
+                            index_where=SecurityMapping.end_date.is_(None),
+                        )
+                        inserted += session.exec(stmt).rowcount
+
+                session.commit()
+                # Cached misses may now have mappings
+                self._active_cache.clear()
+                return inserted
+
+        except Exception as e:
+            logger.warning(f"Failed to bulk import mappings: {e}")
+            return 0
+
+    @staticmethod
+    def _copy_import(session: Session, mappings: Iterable[dict]) -> int:
+        """COPY mappings into a staging table and insert the new ones (PostgreSQL)."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for m in mappings:
+            writer.writerow(
+                (
+                    m["identifier_type"],
+                    m["identifier_value"],
+                    m.get("ticker"),  # None is written as an empty field, i.e. NULL
+                    bool(m.get("has_no_results", False)),
+                )
+            )
+        buffer.seek(0)
+
+        session.exec(
+            text(
+                "CREATE TEMP TABLE security_mappings_import "
+                "(LIKE security_mappings INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+        )
+        with session.connection().connection.cursor() as cursor:
+            cursor.copy_expert(
+                "COPY security_mappings_import "
+                "(identifier_type, identifier_value, ticker, has_no_results) "
+                "FROM STDIN WITH (FORMAT CSV)",
+                buffer,
+            )
+
+        result = session.exec(
+            text(
+                "INSERT INTO security_mappings "
+                "(identifier_type, identifier_value, ticker, has_no_results) "
+                "SELECT identifier_type, identifier_value, ticker, has_no_results "
+                "FROM security_mappings_import "
+                "ON CONFLICT (identifier_type, identifier_value) "
+                "WHERE end_date IS NULL DO NOTHING"
+            )
+        )
+        return result.rowcount
+
     def find_stale_mappings(self, max_age_days: int = 60) -> List[SecurityMapping]:
         """
         Find mappings that need refresh.
@@ -717,17 +1511,94 @@ class SecurityMappingService:
             List of stale SecurityMapping objects
         """
         try:
-            with self.db_manager.get_session() as session:
-                cutoff_date = datetime.now() - timedelta(days=max_age_days)
-                statement = select(SecurityMapping).where(
-                    SecurityMapping.last_fetched_date < cutoff_date,
-                    SecurityMapping.end_date.is_(None),
-                )
-                return list(session.exec(statement).all())
+            return self._select_stale_mappings(max_age_days)
         except Exception as e:
             logger.warning(f"Failed to find stale mappings: {e}")
             return []
 
+    @retry_on_disconnect
+    def _select_stale_mappings(self, max_age_days: int) -> List[SecurityMapping]:
+        """Collect all stale mappings, restarting the stream on a retry."""
+        return list(self.iter_stale_mappings(max_age_days))
+
+    def iter_stale_mappings(
+        self, max_age_days: int = 60, batch_size: int = 1000
+    ) -> Iterator[SecurityMapping]:
+        """
+        Stream mappings that need refresh without loading them all at once.
+
+        Rows are fetched ``batch_size`` at a time while the session stays open
+        for the life of the generator. Database errors propagate to the caller.
+
+        Args:
+            max_age_days: Maximum age in days before considering stale
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            Stale SecurityMapping objects
+        """
+        cutoff_date = datetime.now() - timedelta(days=max_age_days)
+        with self.db_manager.get_session() as session:
+            statement = (
+                select(SecurityMapping)
+                .where(
+                    SecurityMapping.last_fetched_date < cutoff_date,
+                    SecurityMapping.end_date.is_(None),
+                )
+                .execution_options(yield_per=batch_size)
+            )
+            yield from session.exec(statement)
+
+    def iter_stale_identifiers(
+        self, max_age_days: int = 60, batch_size: int = 1000
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Stream just the identifiers of mappings that need refresh, page by page.
+
+        Each page of ``batch_size`` identifiers is read in its own short
+        session and the next one is fetched by key only once the caller has
+        consumed it, so no cursor or transaction stays open while the caller
+        works through a page. Rows refreshed in between are not revisited.
+        Database errors propagate to the caller.
+
+        Args:
+            max_age_days: Maximum age in days before considering stale
+            batch_size: Number of identifiers read per page
+
+        Yields:
+            (identifier_type, identifier_value) tuples
+        """
+        cutoff_date = datetime.now() - timedelta(days=max_age_days)
+        key_columns = (
+            SecurityMapping.identifier_type,
+            SecurityMapping.identifier_value,
+        )
+        statement = (
+            select(SecurityMapping.identifier_type, SecurityMapping.identifier_value)
+            .where(
+                SecurityMapping.last_fetched_date < cutoff_date,
+                SecurityMapping.end_date.is_(None),
+            )
+            .order_by(*key_columns)
+            .limit(batch_size)
+        )
+
+        page_statement = statement
+        while True:
+            with self.db_manager.get_session() as session:
+                page = [tuple(row) for row in session.exec(page_statement)]
+
+            yield from page
+            if len(page) < batch_size:
+                return
+            # Typed binds: PostgreSQL has no enum > varchar comparison
+            last_type, last_value = page[-1]
+            last_key = tuple_(
+                literal(last_type, SecurityMapping.identifier_type.type),
+                literal(last_value, SecurityMapping.identifier_value.type),
+            )
+            page_statement = statement.where(tuple_(*key_columns) > last_key)
+
     def invalidate_mapping(self, identifier_type: str, identifier_value: str) -> bool:
         """
         Invalidate mapping by setting end_date.
@@ -739,21 +1610,22 @@ class SecurityMappingService:
         Returns:
             True if successful, False otherwise
         """
+        self._active_cache.pop((identifier_type, identifier_value))
         try:
             with self.db_manager.get_session() as session:
-                statement = select(SecurityMapping).where(
-                    SecurityMapping.identifier_type == identifier_type,
-                    SecurityMapping.identifier_value == identifier_value,
-                    SecurityMapping.end_date.is_(None),
+                statement = (
+                    update(SecurityMapping)
+                    .where(
+                        SecurityMapping.identifier_type == identifier_type,
+                        SecurityMapping.identifier_value == identifier_value,
+                        SecurityMapping.end_date.is_(None),
+                    )
+                    .values(end_date=func.now())
+                    .returning(SecurityMapping.id)
                 )
-                mapping = session.exec(statement).first()
-                if mapping:
-                    mapping.end_date = datetime.now()
-                    mapping.updated_at = datetime.now()
-                    session.add(mapping)
-                    session.commit()
-                    return True
-                return False
+                invalidated = session.execute(statement).first() is not None
+                session.commit()
+                return invalidated
         except Exception as e:
             logger.warning(
                 f"Failed to invalidate mapping for {identifier_type} {identifier_value}: {e}"
@@ -769,26 +1641,17 @@ class SecurityMappingService:
         """
         try:
             with self.db_manager.get_session() as session:
-                # Total active mappings
-                total_statement = select(SecurityMapping).where(
-                    SecurityMapping.end_date.is_(None)
-                )
-                total = len(list(session.exec(total_statement).all()))
-
-                # Successful mappings (has ticker)
-                success_statement = select(SecurityMapping).where(
-                    SecurityMapping.end_date.is_(None),
-                    SecurityMapping.has_no_results == False,
-                    SecurityMapping.ticker.is_not(None),
-                )
-                successful = len(list(session.exec(success_statement).all()))
-
-                # Failed mappings (no results)
-                failed_statement = select(SecurityMapping).where(
-                    SecurityMapping.end_date.is_(None),
-                    SecurityMapping.has_no_results == True,
-                )
-                failed = len(list(session.exec(failed_statement).all()))
+                # Total, successful (has ticker) and failed (no results) active
+                # mappings, counted in the database in one pass
+                statement = select(
+                    func.count(),
+                    func.count().filter(
+                        SecurityMapping.has_no_results == False,
+                        SecurityMapping.ticker.is_not(None),
+                    ),
+                    func.count().filter(SecurityMapping.has_no_results == True),
+                ).where(SecurityMapping.end_date.is_(None))
+                total, successful, failed = session.exec(statement).one()
 
                 return {
                     "total_cached": total,
@@ -806,26 +1669,89 @@ class SecurityMappingService:
         Returns:
             Number of mappings cleared
         """
+        self._active_cache.clear()
         try:
             with self.db_manager.get_session() as session:
-                statement = select(SecurityMapping).where(
-                    SecurityMapping.end_date.is_(None)
+                statement = (
+                    update(SecurityMapping)
+                    .where(SecurityMapping.end_date.is_(None))
+                    .values(end_date=func.now())
                 )
-                mappings = list(session.exec(statement).all())
-
-                count = 0
-                for mapping in mappings:
-                    mapping.end_date = datetime.now()
-                    mapping.updated_at = datetime.now()
-                    session.add(mapping)
-                    count += 1
-
+                count = session.exec(statement).rowcount
                 session.commit()
                 return count
         except Exception as e:
             logger.warning(f"Failed to clear cache: {e}")
             return 0
 
+    def clear_cache_chunked(self, chunk_size: int = 10_000) -> int:
+        """
+        Clear all cached mappings in bounded chunks, committing after each.
+
+        Keeps the lock footprint of each transaction to ``chunk_size`` rows on
+        very large tables. Rows locked by concurrent writers are skipped, so
+        a few may stay active; their count is logged and they are cleared
+        by the next call.
+
+        Args:
+            chunk_size: Maximum number of mappings ended per transaction
+
+        Returns:
+            Number of mappings cleared
+        """
+        self._active_cache.clear()
+        chunk_ids = (
+            select(SecurityMapping.id)
+            .where(SecurityMapping.end_date.is_(None))
+            .limit(chunk_size)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            update(SecurityMapping)
+            .where(SecurityMapping.id.in_(chunk_ids.scalar_subquery()))
+            .values(end_date=func.now(), updated_at=func.now())
+        )
+
+        total = 0
+        try:
+            with self.db_manager.get_session() as session:
+                while True:
+                    count = session.exec(statement).rowcount
+                    session.commit()
+                    if count == 0:
+                        break
+                    total += count
+
+                remaining = session.exec(
+                    select(func.count())
+                    .select_from(SecurityMapping)
+                    .where(SecurityMapping.end_date.is_(None))
+                ).one()
+                if remaining:
+                    logger.info(
+                        f"Cleared {total} mappings; {remaining} locked by other "
+                        f"sessions are still active"
+                    )
+        except Exception as e:
+            logger.warning(f"Failed to clear cache after {total} mappings: {e}")
+        finally:
+            self._active_cache.clear()
+        return total
+
+
+# Report columns an upsert overwrites when the incoming value is not NULL
+REPORT_UPSERT_COLUMNS = (
+    "filing_date",
+    "report_date",
+    "public_date",
+)
+
+# Report JSON columns an upsert overwrites when the incoming value is not {}
+REPORT_UPSERT_JSON_COLUMNS = (
+    "report_metadata",
+    "raw_data",
+)
+
 
 class SECReportService:
     """Service for CRUD operations on SEC reports."""
@@ -861,55 +1787,115 @@ class SECReportService:
         Returns:
             SECReport if successful, None if failed
         """
+        row = self._report_row(
+            series_id=series_id,
+            accession_number=accession_number,
+            form_type=form_type,
+            filing_date=filing_date,
+            report_date=report_date,
+            public_date=public_date,
+            report_metadata=report_metadata,
+            raw_data=raw_data,
+        )
         try:
             with self.db_manager.get_session() as session:
-                # Check if report already exists
-                existing = session.exec(
-                    select(SECReport).where(
-                        SECReport.series_id == series_id,
-                        SECReport.accession_number == accession_number,
-                        SECReport.form_type == form_type,
-                    )
-                ).first()
-
-                current_time = datetime.now()
-
-                if existing:
-                    # Update existing report
-                    existing.filing_date = filing_date or existing.filing_date
-                    existing.report_date = report_date or existing.report_date
-                    existing.public_date = public_date or existing.public_date
-                    existing.report_metadata = report_metadata or existing.report_metadata
-                    existing.raw_data = raw_data or existing.raw_data
-                    existing.updated_at = current_time
-                    session.add(existing)
-                    report = existing
-                else:
-                    # Create new report
-                    report = SECReport(
-                        series_id=series_id,
-                        accession_number=accession_number,
-                        form_type=form_type,
-                        filing_date=filing_date,
-                        report_date=report_date,
-                        public_date=public_date,
-                        report_metadata=report_metadata or {},
-                        raw_data=raw_data or {},
-                        created_at=current_time,
-                        updated_at=current_time,
-                    )
-                    session.add(report)
-
+                # Insert, or update the existing report in place, in one statement
+                stmt = self._upsert_reports_stmt(session, [row]).returning(SECReport)
+                report = session.exec(stmt).scalar_one()
                 session.commit()
-                session.refresh(report)
                 return report
 
         except Exception as e:
-            logger.error(f"Failed to upsert SEC report {form_type} {accession_number}: {e}")
+            logger.error(
+                f"Failed to upsert SEC report {form_type} {accession_number}: {e}"
+            )
             return None
 
+    def upsert_reports(self, reports: List[dict]) -> int:
+        """
+        Create or update many SEC reports in one session and transaction.
+
+        Args:
+            reports: List of dicts with the keyword arguments of upsert_report
+
+        Returns:
+            Number of reports written, 0 if failed
+        """
+        if not reports:
+            return 0
+
+        # Last write wins for repeated reports within the batch
+        rows = {}
+        for report in reports:
+            row = self._report_row(**report)
+            rows[(row["series_id"], row["accession_number"], row["form_type"])] = row
+
+        try:
+            with self.db_manager.get_session() as session:
+                for batch in _chunks(list(rows.values()), UPSERT_BATCH_SIZE):
+                    session.exec(self._upsert_reports_stmt(session, batch))
+
+                session.commit()
+                return len(rows)
+
+        except Exception as e:
+            logger.error(f"Failed to upsert {len(rows)} SEC reports: {e}")
+            return 0
+
+    @staticmethod
+    def _report_row(
+        series_id: str,
+        accession_number: str,
+        form_type: str,
+        filing_date: Optional[date] = None,
+        report_date: Optional[date] = None,
+        public_date: Optional[date] = None,
+        report_metadata: Optional[dict] = None,
+        raw_data: Optional[dict] = None,
+    ) -> dict:
+        """Build an upsert row; new reports store {} for missing JSON values."""
+        return {
+            "series_id": series_id,
+            "accession_number": accession_number,
+            "form_type": form_type,
+            "filing_date": filing_date,
+            "report_date": report_date,
+            "public_date": public_date,
+            "report_metadata": report_metadata or {},
+            "raw_data": raw_data or {},
+        }
+
+    @staticmethod
+    def _upsert_reports_stmt(session: Session, rows: List[dict]):
+        """INSERT ... ON CONFLICT that only overwrites columns given a value."""
+        stmt = dialect_insert(session, SECReport).values(rows)
+        columns = SECReport.__table__.c
+        set_ = {
+            name: func.coalesce(stmt.excluded[name], columns[name])
+            for name in REPORT_UPSERT_COLUMNS
+        }
+        for name in REPORT_UPSERT_JSON_COLUMNS:
+            # An empty payload keeps the stored one; compared as text so the
+            # same expression works for JSONB and SQLite JSON
+            set_[name] = case(
+                (cast(stmt.excluded[name], Text) == "{}", columns[name]),
+                else_=stmt.excluded[name],
+            )
+        set_["updated_at"] = func.now()
+        return stmt.on_conflict_do_update(
+            index_elements=[
+                SECReport.series_id,
+                SECReport.accession_number,
+                SECReport.form_type,
+            ],
+            set_=set_,
+        )
+
     def get_reports_by_series(
-        self, series_id: str, form_type: Optional[str] = None
+        self,
+        series_id: str,
+        form_type: Optional[str] = None,
+        include_payloads: bool = True,
     ) -> List[SECReport]:
         """
         Get all reports for a series, optionally filtered by form type.
@@ -917,6 +1903,9 @@ class SECReportService:
         Args:
             series_id: Series ID to search for
             form_type: Optional form type filter
+            include_payloads: Load the report_metadata/raw_data JSON columns.
+                When False they are not fetched, and reading them on the
+                returned objects raises; use get_report_raw for the payload.
 
         Returns:
             List of SECReport objects
@@ -924,39 +1913,45 @@ class SECReportService:
         try:
             with self.db_manager.get_session() as session:
                 statement = select(SECReport).where(SECReport.series_id == series_id)
-                
+                if not include_payloads:
+                    statement = statement.options(*_SKIP_REPORT_PAYLOADS)
+
                 if form_type:
                     statement = statement.where(SECReport.form_type == form_type)
-                
+
                 statement = statement.order_by(SECReport.report_date.desc())
-                
+
                 return list(session.exec(statement).all())
         except Exception as e:
             logger.error(f"Failed to get reports for series {series_id}: {e}")
             return []
 
-    def get_pending_downloads(self, form_type: Optional[str] = None) -> List[SECReport]:
+    def get_pending_downloads(
+        self, form_type: Optional[str] = None, include_payloads: bool = True
+    ) -> List[SECReport]:
         """
         Get reports that need to be downloaded.
 
         Args:
             form_type: Optional form type filter
+            include_payloads: Load the report_metadata/raw_data JSON columns.
+                When False they are not fetched, and reading them on the
+                returned objects raises.
 
         Returns:
             List of SECReport objects with pending download status
         """
         try:
             with self.db_manager.get_session() as session:
-                statement = select(SECReport).where(
-                    SECReport.download_status == "pending"
-                )
-                
                 if form_type:
-                    statement = statement.where(SECReport.form_type == form_type)
-                
-                statement = statement.order_by(SECReport.filing_date.desc())
-                
-                return list(session.exec(statement).all())
+                    statement = _PENDING_DOWNLOADS_BY_FORM_STMT
+                    params = {"form_type": form_type}
+                else:
+                    statement = _PENDING_DOWNLOADS_STMT
+                    params = None
+                if not include_payloads:
+                    statement = statement.options(*_SKIP_REPORT_PAYLOADS)
+                return list(session.exec(statement, params=params).all())
         except Exception as e:
             logger.error(f"Failed to get pending downloads: {e}")
             return []
@@ -967,6 +1962,7 @@ class SECReportService:
         status: str,
         file_paths: Optional[dict] = None,
         error_message: Optional[str] = None,
+        session: Optional[Session] = None,
     ) -> bool:
         """
         Update download status for a report.
@@ -976,36 +1972,143 @@ class SECReportService:
             status: New status (pending, downloaded, failed)
             file_paths: Optional file paths dictionary
             error_message: Optional error message
+            session: Optional caller-owned session; the caller commits
 
         Returns:
             True if successful, False otherwise
         """
+        owns_session = session is None
         try:
-            with self.db_manager.get_session() as session:
+            with self.db_manager.session_scope(session) as session:
                 report = session.get(SECReport, report_id)
                 if report:
                     report.download_status = status
-                    report.updated_at = datetime.now()
-                    
+
                     if file_paths:
                         report.file_paths = file_paths
-                    
+
                     if error_message:
                         report.error_message = error_message
-                    
+
                     session.add(report)
-                    session.commit()
+                    if owns_session:
+                        session.commit()
                     return True
                 return False
         except Exception as e:
-            logger.error(f"Failed to update download status for report {report_id}: {e}")
+            logger.error(
+                f"Failed to update download status for report {report_id}: {e}"
+            )
+            return False
+
+    def update_statuses(
+        self,
+        report_id: int,
+        *,
+        download_status: Optional[str] = None,
+        processing_status: Optional[str] = None,
+        file_paths: Optional[dict] = None,
+        error_message: Optional[str] = None,
+    ) -> bool:
+        """
+        Update download and/or processing status for a report in one statement.
+
+        Only the arguments given are written; the row is not loaded first.
+
+        Args:
+            report_id: Report ID
+            download_status: New download status (pending, downloaded, failed)
+            processing_status: New processing status (pending, processed, failed)
+            file_paths: Optional file paths dictionary
+            error_message: Optional error message
+
+        Returns:
+            True if the report was updated, False otherwise
+        """
+        values = {}
+        if download_status:
+            values["download_status"] = download_status
+        if processing_status:
+            values["processing_status"] = processing_status
+            values["last_processed_at"] = func.now()
+        if file_paths:
+            values["file_paths"] = file_paths
+        if error_message:
+            values["error_message"] = error_message
+        if not values:
+            return False
+
+        try:
+            with self.db_manager.get_session() as session:
+                result = session.exec(
+                    update(SECReport).where(SECReport.id == report_id).values(**values)
+                )
+                session.commit()
+                return result.rowcount > 0
+        except Exception as e:
+            logger.error(f"Failed to update statuses for report {report_id}: {e}")
             return False
 
+    def bulk_update_download_status(self, updates: List[dict]) -> int:
+        """
+        Update download status for many reports in one transaction.
+
+        Updates that set the same columns share one UPDATE statement sent as
+        a single executemany. Unknown report IDs are skipped and not counted.
+
+        Args:
+            updates: List of dicts with report_id and status keys, and optional
+                file_paths and error_message keys (omitted or None leaves the
+                stored value unchanged)
+
+        Returns:
+            Number of reports updated, 0 if failed
+        """
+        if not updates:
+            return 0
+
+        # Group parameter sets by the columns they assign
+        groups = {}
+        for item in updates:
+            row = {"download_status": item["status"]}
+            if item.get("file_paths"):
+                row["file_paths"] = item["file_paths"]
+            if item.get("error_message"):
+                row["error_message"] = item["error_message"]
+            params = {f"new_{name}": value for name, value in row.items()}
+            params["report_id"] = item["report_id"]
+            groups.setdefault(tuple(row), []).append(params)
+
+        table = SECReport.__table__
+        try:
+            with self.db_manager.get_session() as session:
+                updated = 0
+                for names, params in groups.items():
+                    stmt = (
+                        update(table)
+                        .where(table.c.id == bindparam("report_id"))
+                        .values(
+                            {
+                                name: bindparam(f"new_{name}", type_=table.c[name].type)
+                                for name in names
+                            }
+                        )
+                    )
+                    updated += session.connection().execute(stmt, params).rowcount
+                session.commit()
+                return updated
+        except Exception as e:
+            logger.error(
+                f"Failed to update download status for {len(updates)} reports: {e}"
+            )
+            return 0
+
     def update_processing_status(
         self,
         report_id: int,
         status: str,
         error_message: Optional[str] = None,
+        session: Optional[Session] = None,
     ) -> bool:
         """
         Update processing status for a report.
@@ -1014,29 +2117,87 @@ class SECReportService:
             report_id: Report ID
             status: New status (pending, processed, failed)
             error_message: Optional error message
+            session: Optional caller-owned session; the caller commits
 
         Returns:
             True if successful, False otherwise
         """
+        owns_session = session is None
         try:
-            with self.db_manager.get_session() as session:
+            with self.db_manager.session_scope(session) as session:
                 report = session.get(SECReport, report_id)
                 if report:
                     report.processing_status = status
-                    report.updated_at = datetime.now()
-                    report.last_processed_at = datetime.now()
-                    
+                    report.last_processed_at = func.now()
+
                     if error_message:
                         report.error_message = error_message
-                    
+
                     session.add(report)
-                    session.commit()
+                    if owns_session:
+                        session.commit()
                     return True
                 return False
         except Exception as e:
-            logger.error(f"Failed to update processing status for report {report_id}: {e}")
+            logger.error(
+                f"Failed to update processing status for report {report_id}: {e}"
+            )
             return False
 
+    def get_report_status(self, report_id: int) -> Optional[dict]:
+        """
+        Get download/processing status for a report without loading its JSON payloads.
+
+        Args:
+            report_id: Report ID
+
+        Returns:
+            Dictionary with id, download_status and processing_status, or None if not found
+        """
+        try:
+            with self.db_manager.get_session() as session:
+                row = session.exec(
+                    select(
+                        SECReport.id,
+                        SECReport.download_status,
+                        SECReport.processing_status,
+                    ).where(SECReport.id == report_id)
+                ).first()
+
+                if row is None:
+                    return None
+
+                return {
+                    "id": row[0],
+                    "download_status": row[1],
+                    "processing_status": row[2],
+                }
+        except Exception as e:
+            logger.error(f"Failed to get status for report {report_id}: {e}")
+            return None
+
+    def get_report_raw(self, report_id: int) -> Optional[dict]:
+        """
+        Get only the raw SEC data for a report.
+
+        raw_data can be large and is stored out of line; fetch it through this
+        method when it is actually needed instead of loading full rows.
+
+        Args:
+            report_id: Report ID
+
+        Returns:
+            Raw data dictionary, or None if not found
+        """
+        try:
+            with self.db_manager.get_session() as session:
+                return session.exec(
+                    select(SECReport.raw_data).where(SECReport.id == report_id)
+                ).first()
+        except Exception as e:
+            logger.error(f"Failed to get raw data for report {report_id}: {e}")
+            return None
+
     def get_reports_stats(self) -> dict:
         """
         Get statistics about SEC reports in the database.
@@ -1046,36 +2207,52 @@ class SECReportService:
         """
         try:
             with self.db_manager.get_session() as session:
-                # Total reports by form type
-                all_reports = list(session.exec(select(SECReport)).all())
-                
+                # Count per (form type, download status, processing status) in
+                # the database; the handful of groups is folded into each breakdown
+                statement = select(
+                    SECReport.form_type,
+                    SECReport.download_status,
+                    SECReport.processing_status,
+                    func.count(),
+                ).group_by(
+                    SECReport.form_type,
+                    SECReport.download_status,
+                    SECReport.processing_status,
+                )
+
                 stats = {
-                    "total_reports": len(all_reports),
+                    "total_reports": 0,
                     "by_form_type": {},
                     "by_download_status": {},
                     "by_processing_status": {},
                 }
-                
-                for report in all_reports:
-                    # Count by form type
-                    stats["by_form_type"][report.form_type] = (
-                        stats["by_form_type"].get(report.form_type, 0) + 1
+
+                for (
+                    form_type,
+                    download_status,
+                    processing_status,
+                    count,
+                ) in session.exec(statement):
+                    stats["total_reports"] += count
+                    stats["by_form_type"][form_type] = (
+                        stats["by_form_type"].get(form_type, 0) + count
                     )
-                    
-                    # Count by download status
-                    stats["by_download_status"][report.download_status] = (
-                        stats["by_download_status"].get(report.download_status, 0) + 1
+                    stats["by_download_status"][download_status] = (
+                        stats["by_download_status"].get(download_status, 0) + count
                     )
-                    
-                    # Count by processing status
-                    stats["by_processing_status"][report.processing_status] = (
-                        stats["by_processing_status"].get(report.processing_status, 0) + 1
+                    stats["by_processing_status"][processing_status] = (
+                        stats["by_processing_status"].get(processing_status, 0) + count
                     )
-                
+
                 return stats
         except Exception as e:
             logger.error(f"Failed to get reports stats: {e}")
-            return {"total_reports": 0, "by_form_type": {}, "by_download_status": {}, "by_processing_status": {}}
+            return {
+                "total_reports": 0,
+                "by_form_type": {},
+                "by_download_status": {},
+                "by_processing_status": {},
+            }
 
     def get_latest_report_by_form(
         self, series_id: str, form_type: str
@@ -1092,16 +2269,12 @@ class SECReportService:
         """
         try:
             with self.db_manager.get_session() as session:
-                statement = (
-                    select(SECReport)
-                    .where(
-                        SECReport.series_id == series_id,
-                        SECReport.form_type == form_type,
-                    )
-                    .order_by(SECReport.report_date.desc())
-                )
-                
-                return session.exec(statement).first()
+                return session.exec(
+                    _LATEST_REPORT_BY_FORM_STMT,
+                    params={"series_id": series_id, "form_type": form_type},
+                ).first()
         except Exception as e:
-            logger.error(f"Failed to get latest report for {series_id} {form_type}: {e}")
+            logger.error(
+                f"Failed to get latest report for {series_id} {form_type}: {e}"
+            )
             return None
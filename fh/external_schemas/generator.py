@@ -12,20 +12,33 @@ Usage:
 
 import argparse
 import importlib
-import inspect
 import json
 import os
 import sys
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+# Add parent directory to path for imports (once, even if this module is reloaded)
+_PARENT_DIR = str(Path(__file__).parent.parent)
+if _PARENT_DIR not in sys.path:
+    sys.path.append(_PARENT_DIR)
 
 import pandera.pandas as pa
 from pandera.typing import DataFrame, Series
 
+# (mtime, schema classes) found per schema file path
+_SCHEMA_CACHE: Dict[str, Tuple[float, List[Type[pa.DataFrameModel]]]] = {}
+
+# JSON Schema type by numpy dtype kind; datetimes ("M") and the rest are strings
+_DTYPE_KIND_JSON_TYPES = {
+    "i": "integer",
+    "u": "integer",
+    "f": "number",
+    "b": "boolean",
+}
+
 
 class JSONSchemaGenerator:
     """Generate JSON Schema from Pandera DataFrameModel schemas."""
@@ -36,7 +49,11 @@ class JSONSchemaGenerator:
             output_dir = Path(__file__).parent
         self.output_dir = Path(output_dir)
         self.internal_schemas_dir = Path(__file__).parent.parent / "internal_schemas"
-        self.timestamp = datetime.now().isoformat()
+
+    @cached_property
+    def timestamp(self) -> str:
+        """Generation timestamp, fixed on first use."""
+        return datetime.now().isoformat()
 
     def discover_schema_files(self) -> List[Path]:
         """
@@ -70,6 +87,15 @@ class JSONSchemaGenerator:
         Returns:
             List of Pandera DataFrameModel classes
         """
+        # Skip the import and class scan if the file is unchanged since last time
+        cache_key = str(file_path)
+        mtime = file_path.stat().st_mtime
+        cached = _SCHEMA_CACHE.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            for schema_class in cached[1]:
+                print(f"  Found schema: {schema_class.__name__}")
+            return list(cached[1])
+
         schemas = []
 
         # Convert file path to module name
@@ -79,22 +105,30 @@ class JSONSchemaGenerator:
         try:
             # Import the module
             module = importlib.import_module(module_name)
+            if cached is not None:
+                # Changed since the last scan; import_module returned the old module
+                module = importlib.reload(module)
 
             # Find all DataFrameModel classes (including inherited ones)
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                # Check if it's a Pandera DataFrameModel (directly or through inheritance)
-                if hasattr(obj, "__mro__") and any(
-                    base.__name__ == "DataFrameModel" for base in obj.__mro__
+            for obj in vars(module).values():
+                # Only include classes defined in this module (not imported ones)
+                if (
+                    isinstance(obj, type)
+                    and obj.__module__ == module.__name__
+                    and issubclass(obj, pa.DataFrameModel)
                 ):
-                    # Only include classes defined in this module (not imported ones)
-                    if obj.__module__ == module.__name__:
-                        schemas.append(obj)
-                        print(f"  Found schema: {name}")
+                    schemas.append(obj)
+
+            schemas.sort(key=lambda schema_class: schema_class.__name__)
+            for schema_class in schemas:
+                print(f"  Found schema: {schema_class.__name__}")
+
+            _SCHEMA_CACHE[cache_key] = (mtime, schemas)
 
         except Exception as e:
             print(f"Error importing {module_name}: {e}")
 
-        return schemas
+        return list(schemas)
 
     def pandera_to_json_schema(
         self, schema_class: Type[pa.DataFrameModel]
@@ -121,11 +155,11 @@ class JSONSchemaGenerator:
 
             field_def = {
                 "type": field_type,
-                "description": getattr(column_schema, "description", ""),
+                "description": column_schema.description,
             }
 
             # Handle nullable fields
-            if getattr(column_schema, "nullable", False):
+            if column_schema.nullable:
                 if isinstance(field_def["type"], str):
                     field_def["type"] = [field_def["type"], "null"]
                 else:
@@ -159,6 +193,11 @@ class JSONSchemaGenerator:
         Returns:
             JSON Schema type string
         """
+        # numpy and pandas extension dtypes both expose a one-letter kind
+        kind = getattr(getattr(pandera_type, "type", None), "kind", None)
+        if kind is not None:
+            return _DTYPE_KIND_JSON_TYPES.get(kind, "string")
+
         type_str = str(pandera_type).lower()
 
         if "int" in type_str:
@@ -184,6 +223,8 @@ class JSONSchemaGenerator:
         print(f"Found {len(schema_files)} schema files")
 
         all_schemas = {}
+        # Top-level properties that reference the definitions
+        top_properties = {}
 
         for file_path in schema_files:
             print(f"\nProcessing {file_path.name}...")
@@ -193,6 +234,9 @@ class JSONSchemaGenerator:
                 schema_name = schema_class.__name__
                 json_schema = self.pandera_to_json_schema(schema_class)
                 all_schemas[schema_name] = json_schema
+                top_properties[schema_name.lower().replace("schema", "")] = {
+                    "$ref": f"#/definitions/{schema_name}"
+                }
 
         # Create the combined schema
         combined_schema = {
@@ -201,13 +245,7 @@ class JSONSchemaGenerator:
             "description": f"Combined JSON Schema for all fund holdings data structures. Generated from Pandera schemas at {self.timestamp}",
             "type": "object",
             "definitions": all_schemas,
-            "properties": {
-                # Add top-level properties that reference the definitions
-                schema_name.lower().replace("schema", ""): {
-                    "$ref": f"#/definitions/{schema_name}"
-                }
-                for schema_name in all_schemas.keys()
-            },
+            "properties": top_properties,
         }
 
         return combined_schema
@@ -1,11 +1,19 @@
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple
 
 from loguru import logger
-from parse_nport import NPortParser
+
+# Pattern: nport_{cik}_{series_id}_{accession_number}
+_FILENAME_RE = re.compile(r'^nport_([0-9]{10})_([A-Z][0-9]{9})_(.+)$')
+
+# Directories already created during this run; each worker process keeps its own
+_ensured_dirs: Set[Path] = set()
 
 def get_data_dir():
     return Path(__file__).parent.parent / "data"
@@ -23,9 +31,7 @@ def extract_metadata_from_filename(xml_file_path: Path) -> Tuple[Optional[str],
     """
     filename = xml_file_path.stem
     
-    # Pattern: nport_{cik}_{series_id}_{accession_number}
-    pattern = r'^nport_([0-9]{10})_([A-Z][0-9]{9})_(.+)$'
-    match = re.match(pattern, filename)
+    match = _FILENAME_RE.match(filename)
     
     if match:
         cik, series_id, accession_number = match.groups()
@@ -35,88 +41,160 @@ def extract_metadata_from_filename(xml_file_path: Path) -> Tuple[Optional[str],
         return None, None, None
 
 
-def process_downloaded_xml_files(nport_files: List[Path]) -> int:
+def _ensure_dir(directory: Path) -> None:
+    """Create a directory (and parents) once per run."""
+    if directory not in _ensured_dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(directory)
+
+
+def _process_one(xml_file_path: Path, log_summary: bool = False) -> Tuple[int, str]:
+    """
+    Parse one N-PORT XML file and write its holdings to CSV.
+
+    Runs in a worker process, so only the small result tuple is sent back.
+
+    Args:
+        xml_file_path: Path to an N-PORT XML file
+        log_summary: Build a DataFrame to log total value and top holdings;
+                     otherwise holdings are streamed straight to the CSV
+
+    Returns:
+        Tuple of (holdings_count, csv_path), or (0, "") if nothing was written
+    """
+    try:
+        logger.info(f"  └─ Processing: {xml_file_path.name}")
+
+        # Extract metadata from filename
+        cik, series_id, accession_number = extract_metadata_from_filename(xml_file_path)
+
+        if not all([cik, series_id, accession_number]):
+            logger.error(f"    │ Could not extract required metadata from filename")
+            return 0, ""
+
+        # Imported here so the CLI can exit early without loading pandas/pandera
+        from parse_nport import NPortParser
+
+        # Parse XML to extract holdings using updated API
+        parser = NPortParser(str(xml_file_path))
+
+        # Write under a temporary name and rename once complete, so an
+        # interrupted run never leaves a truncated CSV under its final name
+        partial_path = get_data_dir() / "holdings_raw" / f"{xml_file_path.stem}.csv.partial"
+        _ensure_dir(partial_path.parent)
+
+        if log_summary:
+            holdings_df, fund_info = parser.to_dataframes()
+            holdings_count = 0 if holdings_df is None else len(holdings_df)
+        else:
+            # The final name needs the report date, so stream to the partial file
+            holdings_df = None
+            holdings_count, fund_info = parser.to_csv(str(partial_path))
+
+        if not holdings_count:
+            logger.warning(f"    │ No holdings data found in {xml_file_path.name}")
+            return 0, ""
+
+        # Extract report date from fund info or use default
+        report_date = fund_info.get("report_period_date", "")
+        if report_date:
+            # Convert YYYY-MM-DD to YYYYMMDD
+            try:
+                report_date_obj = datetime.strptime(report_date, "%Y-%m-%d")
+                report_date_str = report_date_obj.strftime("%Y%m%d")
+            except ValueError:
+                report_date_str = "unknown"
+        else:
+            report_date_str = "unknown"
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        # Create organized folder structure: holdings_raw/{cik}/{series_id}/
+        holdings_raw_dir = get_data_dir() / "holdings_raw" / cik / series_id
+        _ensure_dir(holdings_raw_dir)
+
+        # Generate CSV filename (simplified since it's in organized folders)
+        csv_filename = f"holdings_raw_{cik}_{series_id}_{report_date_str}_{timestamp}.csv"
+        csv_file_path = holdings_raw_dir / csv_filename
+
+        # Save holdings to CSV
+        if holdings_df is not None:
+            try:
+                holdings_df.to_csv(partial_path, index=False)
+            except Exception:
+                partial_path.unlink(missing_ok=True)
+                raise
+        os.replace(partial_path, csv_file_path)
+
+        logger.info(f"    │ Processed {holdings_count} holdings → {csv_filename}")
+        logger.info(f"    │ Saved to: holdings_raw/{cik}/{series_id}/")
+        logger.info(f"    │ Fund: {fund_info.get('fund_name', 'Unknown')}")
+        logger.info(f"    │ Report Date: {report_date or 'Unknown'}")
+
+        # Log top holdings info if available
+        if holdings_df is not None and 'value_usd' in holdings_df.columns:
+            import numpy as np
+
+            values = holdings_df['value_usd'].to_numpy()
+            total_value = values.sum()
+            # Partial partition for the top 3, then order just those
+            top_count = min(3, len(values))
+            top_idx = np.argpartition(-values, top_count - 1)[:top_count]
+            top_idx = top_idx[np.argsort(-values[top_idx])]
+            top_names = holdings_df['name'].to_numpy()[top_idx].tolist()
+            logger.info(f"    │ Total Value: ${total_value:,.0f}")
+            logger.info(f"    │ Top Holdings: {', '.join(top_names)}")
+
+        return holdings_count, str(csv_file_path)
+
+    except Exception as e:
+        logger.error(f"    │ Error processing {xml_file_path.name}: {e}")
+        return 0, ""
+
+
+def process_downloaded_xml_files(
+    nport_files: List[Path],
+    max_workers: Optional[int] = None,
+    log_summary: bool = False,
+) -> Tuple[int, List[Path]]:
     """
     Process downloaded XML files to extract holdings data (standalone version).
+
+    Files are independent, so they are parsed in parallel worker processes.
     
     Args:
         nport_files: List of Path objects pointing to N-PORT XML files
+        max_workers: Number of worker processes (defaults to the CPU count);
+                     1 processes the files in this process
+        log_summary: Log total value and top holdings per file (slower, as
+                     each file is loaded into a DataFrame)
 
     Returns:
-        Number of XML files successfully processed
+        Tuple of (number of XML files successfully processed, CSV paths written)
     """
     logger.info("=== Processing N-PORT XML Files ===")
     logger.info(f"Processing {len(nport_files)} XML files")
     
-    processed_count = 0
-    data_dir = get_data_dir()
-    
     # Ensure data directory exists
-    data_dir.mkdir(exist_ok=True)
-
-    for xml_file_path in nport_files:
-        try:
-            logger.info(f"  └─ Processing: {xml_file_path.name}")
-            
-            # Extract metadata from filename
-            cik, series_id, accession_number = extract_metadata_from_filename(xml_file_path)
-            
-            if not all([cik, series_id, accession_number]):
-                logger.error(f"    │ Could not extract required metadata from filename")
-                continue
-            
-            # Parse XML to extract holdings using updated API
-            parser = NPortParser(str(xml_file_path))
-            holdings_df, fund_info = parser.to_dataframes()
+    get_data_dir().mkdir(exist_ok=True)
+    _ensured_dirs.clear()
 
-            if holdings_df is not None and not holdings_df.empty:
-                # Extract report date from fund info or use default
-                report_date = fund_info.get("report_period_date", "")
-                if report_date:
-                    # Convert YYYY-MM-DD to YYYYMMDD
-                    try:
-                        report_date_obj = datetime.strptime(report_date, "%Y-%m-%d")
-                        report_date_str = report_date_obj.strftime("%Y%m%d")
-                    except ValueError:
-                        report_date_str = "unknown"
-                else:
-                    report_date_str = "unknown"
-                
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                
-                # Create organized folder structure: holdings_raw/{cik}/{series_id}/
-                holdings_raw_dir = data_dir / "holdings_raw" / cik / series_id
-                holdings_raw_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Generate CSV filename (simplified since it's in organized folders)
-                csv_filename = f"holdings_raw_{cik}_{series_id}_{report_date_str}_{timestamp}.csv"
-                csv_file_path = holdings_raw_dir / csv_filename
-                
-                # Save holdings to CSV
-                holdings_df.to_csv(csv_file_path, index=False)
-                
-                processed_count += 1
-                logger.info(f"    │ Processed {len(holdings_df)} holdings → {csv_filename}")
-                logger.info(f"    │ Saved to: holdings_raw/{cik}/{series_id}/")
-                logger.info(f"    │ Fund: {fund_info.get('fund_name', 'Unknown')}")
-                logger.info(f"    │ Report Date: {report_date or 'Unknown'}")
-                
-                # Log top holdings info if available
-                if 'value_usd' in holdings_df.columns:
-                    top_holdings = holdings_df.nlargest(3, 'value_usd')
-                    total_value = holdings_df['value_usd'].sum()
-                    logger.info(f"    │ Total Value: ${total_value:,.0f}")
-                    logger.info(f"    │ Top Holdings: {', '.join(top_holdings['name'].head(3).tolist())}")
-                    
-            else:
-                logger.warning(f"    │ No holdings data found in {xml_file_path.name}")
-
-        except Exception as e:
-            logger.error(f"    │ Error processing {xml_file_path.name}: {e}")
-            continue
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(nport_files))
+
+    process_one = partial(_process_one, log_summary=log_summary)
+    if max_workers <= 1:
+        results = [process_one(xml_file_path) for xml_file_path in nport_files]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(process_one, nport_files))
+
+    written = [Path(csv_path) for _, csv_path in results if csv_path]
+    processed_count = len(written)
 
     logger.info(f"Successfully processed {processed_count}/{len(nport_files)} XML files")
-    return processed_count
+    return processed_count, written
 
 
 def find_xml_files_for_series(series_id: str, data_dir: Optional[Path] = None) -> List[Path]:
@@ -134,15 +212,23 @@ def find_xml_files_for_series(series_id: str, data_dir: Optional[Path] = None) -
         data_dir = get_data_dir()
     
     # Search for XML files containing the series ID in the filename
-    xml_files = []
-    pattern = f"*{series_id}*.xml"
-    
-    for xml_file in data_dir.glob(pattern):
-        if xml_file.is_file():
-            xml_files.append(xml_file)
+    try:
+        with os.scandir(data_dir) as entries:
+            matches = [
+                entry
+                for entry in entries
+                if series_id in entry.name
+                and entry.name.endswith(".xml")
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        # A missing directory simply has no XML files
+        matches = []
     
-    # Sort by filename for consistent processing order
-    xml_files.sort(key=lambda p: p.name)
+    # Sort by filename for consistent processing order (DirEntry.name is a
+    # plain attribute, unlike Path.name)
+    matches.sort(key=attrgetter("name"))
+    xml_files = [Path(entry.path) for entry in matches]
     
     logger.info(f"Found {len(xml_files)} XML files for series {series_id}")
     return xml_files
@@ -177,7 +263,7 @@ if __name__ == "__main__":
     
     # Process the XML files
     logger.info("")
-    processed_count = process_downloaded_xml_files(xml_files)
+    processed_count, recent_csv = process_downloaded_xml_files(xml_files)
     
     # Summary
     logger.info("")
@@ -187,9 +273,6 @@ if __name__ == "__main__":
     
     # Show generated CSV files from organized folder structure
     data_dir = get_data_dir()
-    holdings_raw_dir = data_dir / "holdings_raw"
-    csv_files = list(holdings_raw_dir.glob("**/holdings_raw_*.csv"))  # Recursive search
-    recent_csv = sorted(csv_files, key=lambda p: p.stat().st_mtime, reverse=True)[:processed_count]
     
     if recent_csv:
         logger.info(f"Generated CSV files:")
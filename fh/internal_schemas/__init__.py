@@ -2,8 +2,22 @@
 Internal schemas for fund holdings data structures using Pandera
 """
 
-from .holdings_schema import HoldingsEnrichedSchema, HoldingsRawSchema
-from .summary_ticker_schema import SummaryTickerSchema
-
 __version__ = "0.1.0"
 __all__ = ["HoldingsRawSchema", "HoldingsEnrichedSchema", "SummaryTickerSchema"]
+
+# Schema modules import pandera, so load them on first attribute access
+_LAZY_IMPORTS = {
+    "HoldingsRawSchema": ".holdings_schema",
+    "HoldingsEnrichedSchema": ".holdings_schema",
+    "SummaryTickerSchema": ".summary_ticker_schema",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
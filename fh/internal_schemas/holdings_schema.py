@@ -8,7 +8,7 @@ from typing import Optional
 
 import pandas as pd
 import pandera.pandas as pa
-from pandera.typing import DataFrame, Series
+from pandera.typing import Category, DataFrame, Series
 
 
 class HoldingsRawSchema(pa.DataFrameModel):
@@ -32,10 +32,10 @@ class HoldingsRawSchema(pa.DataFrameModel):
 
     # Position data
     balance: Series[float] = pa.Field(description="Security balance/shares")
-    units: Series[str] = pa.Field(
+    units: Series[Category] = pa.Field(
         description="Units of measurement (e.g., 'NS' for number of shares)"
     )
-    currency: Series[str] = pa.Field(description="Currency code")
+    currency: Series[Category] = pa.Field(description="Currency code")
     value_usd: Series[float] = pa.Field(
         description="Market value in USD (can be negative for short positions)"
     )
@@ -44,23 +44,23 @@ class HoldingsRawSchema(pa.DataFrameModel):
     )
 
     # Classification data
-    payoff_profile: Series[str] = pa.Field(
+    payoff_profile: Series[Category] = pa.Field(
         description="Payoff profile (e.g., 'Long', 'Short')"
     )
-    asset_category: Series[str] = pa.Field(description="Asset category code")
-    issuer_category: Series[str] = pa.Field(description="Issuer category code")
-    investment_country: Series[str] = pa.Field(description="Investment country code")
+    asset_category: Series[Category] = pa.Field(description="Asset category code")
+    issuer_category: Series[Category] = pa.Field(description="Issuer category code")
+    investment_country: Series[Category] = pa.Field(description="Investment country code")
 
     # Regulatory flags
-    is_restricted_security: Series[str] = pa.Field(
+    is_restricted_security: Series[Category] = pa.Field(
         description="Restricted security flag"
     )
-    fair_value_level: Series[str] = pa.Field(description="Fair value level")
-    is_cash_collateral: Series[str] = pa.Field(description="Cash collateral flag")
-    is_non_cash_collateral: Series[str] = pa.Field(
+    fair_value_level: Series[Category] = pa.Field(description="Fair value level")
+    is_cash_collateral: Series[Category] = pa.Field(description="Cash collateral flag")
+    is_non_cash_collateral: Series[Category] = pa.Field(
         description="Non-cash collateral flag"
     )
-    is_loan_by_fund: Series[str] = pa.Field(description="Loan by fund flag")
+    is_loan_by_fund: Series[Category] = pa.Field(description="Loan by fund flag")
 
     # Loan data
     loan_value: Series[float] = pa.Field(
@@ -74,6 +74,12 @@ class OpenFIGIClient:
             self.db_manager = None
             self.mapping_service = None
 
+        # Number of API results accumulated before writing them to the cache
+        self.cache_write_batch_size = 100
+
+        # Mapping jobs per request: OpenFIGI allows 100 with an API key, 10 without
+        self.max_jobs_per_request = 100 if api_key else 10
+
         # Rate limiting: 25 requests per 7 seconds
         self.last_request_time = 0
         self.min_interval = 7 / 25  # 0.28 seconds between requests
@@ -245,35 +251,49 @@ class OpenFIGIClient:
         max_age = max_age_days or self.cache_max_age_days
         
         try:
-            stale_mappings = self.mapping_service.find_stale_mappings(max_age)
-            logger.info(f"Found {len(stale_mappings)} stale cache entries to refresh")
+            logger.info(f"Refreshing cache entries older than {max_age} days")
             
             refreshed_count = 0
-            for mapping in stale_mappings:
+            stale_count = 0
+            pending = []
+            # Pages are read in short sessions, so no cursor stays open across
+            # the rate-limited API calls
+            stale_identifiers = self.mapping_service.iter_stale_identifiers(
+                max_age, batch_size=self.cache_write_batch_size
+            )
+            for identifier_type, identifier_value in stale_identifiers:
+                stale_count += 1
                 try:
-                    logger.debug(f"Refreshing {mapping.identifier_type} {mapping.identifier_value}")
+                    logger.debug(f"Refreshing {identifier_type} {identifier_value}")
                     
                     # Re-fetch from API
-                    if mapping.identifier_type == 'CUSIP':
-                        new_ticker = self._fetch_ticker_from_api(mapping.identifier_value)
+                    if identifier_type == 'CUSIP':
+                        new_ticker = self._fetch_ticker_from_api(identifier_value)
                     else:  # ISIN
-                        new_ticker = self._fetch_ticker_from_api_isin(mapping.identifier_value)
+                        new_ticker = self._fetch_ticker_from_api_isin(identifier_value)
                     
-                    # Update cache
-                    self.mapping_service.create_or_update_mapping(
-                        mapping.identifier_type, 
-                        mapping.identifier_value, 
-                        new_ticker, 
-                        has_no_results=(new_ticker is None)
+                    pending.append(
+                        {
+                            "identifier_type": identifier_type,
+                            "identifier_value": identifier_value,
+                            "ticker": new_ticker,
+                            "has_no_results": new_ticker is None,
+                        }
                     )
-                    refreshed_count += 1
                     
-                    logger.debug(f"Refreshed {mapping.identifier_type} {mapping.identifier_value} -> {new_ticker}")
+                    logger.debug(f"Refreshed {identifier_type} {identifier_value} -> {new_ticker}")
                     
                 except Exception as e:
-                    logger.warning(f"Failed to refresh {mapping.identifier_type} {mapping.identifier_value}: {e}")
+                    logger.warning(f"Failed to refresh {identifier_type} {identifier_value}: {e}")
+
+                # Write results back to the cache one page at a time
+                if len(pending) >= self.cache_write_batch_size:
+                    refreshed_count += self.mapping_service.create_or_update_mappings(pending)
+                    pending = []
+
+            refreshed_count += self.mapping_service.create_or_update_mappings(pending)
             
-            logger.info(f"Successfully refreshed {refreshed_count}/{len(stale_mappings)} stale cache entries")
+            logger.info(f"Successfully refreshed {refreshed_count}/{stale_count} stale cache entries")
             return refreshed_count
             
         except Exception as e:
@@ -306,26 +326,28 @@ class OpenFIGIClient:
             
             logger.info(f"Migrating {len(json_cache)} entries from JSON cache to database")
             
-            migrated_count = 0
+            mappings = []
             for identifier, ticker in json_cache.items():
-                try:
-                    # Determine identifier type based on length
-                    if len(identifier) == 9:
-                        identifier_type = 'CUSIP'
-                    elif len(identifier) == 12:
-                        identifier_type = 'ISIN'
-                    else:
-                        logger.warning(f"Unknown identifier format: {identifier}")
-                        continue
-                    
-                    # Migrate to database
-                    self.mapping_service.create_or_update_mapping(
-                        identifier_type, identifier, ticker, has_no_results=False
-                    )
-                    migrated_count += 1
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to migrate {identifier}: {e}")
+                # Determine identifier type based on length
+                if len(identifier) == 9:
+                    identifier_type = 'CUSIP'
+                elif len(identifier) == 12:
+                    identifier_type = 'ISIN'
+                else:
+                    logger.warning(f"Unknown identifier format: {identifier}")
+                    continue
+
+                mappings.append(
+                    {
+                        "identifier_type": identifier_type,
+                        "identifier_value": identifier,
+                        "ticker": ticker,
+                        "has_no_results": False,
+                    }
+                )
+
+            # Migrate to database in one transaction
+            migrated_count = self.mapping_service.create_or_update_mappings(mappings)
             
             logger.info(f"Successfully migrated {migrated_count}/{len(json_cache)} entries from JSON to database")
             return migrated_count
@@ -350,7 +372,7 @@ class OpenFIGIClient:
 
         # Try database cache first
         if self.mapping_service:
-            mapping = self.mapping_service.get_active_mapping('CUSIP', cusip)
+            mapping = self.mapping_service.get_active_ticker('CUSIP', cusip)
             if mapping:
                 if mapping.has_no_results:
                     logger.debug(f"Database cache hit: CUSIP {cusip} has no results")
@@ -400,7 +422,7 @@ class OpenFIGIClient:
 
         # Try database cache first
         if self.mapping_service:
-            mapping = self.mapping_service.get_active_mapping('ISIN', isin)
+            mapping = self.mapping_service.get_active_ticker('ISIN', isin)
             if mapping:
                 if mapping.has_no_results:
                     logger.debug(f"Database cache hit: ISIN {isin} has no results")
@@ -460,17 +482,11 @@ class OpenFIGIClient:
                 data = response.json()
 
                 # Parse response to extract ticker
-                if data and len(data) > 0 and "data" in data[0]:
-                    for item in data[0]["data"]:
-                        # Look for equity instruments with ticker symbols
-                        if (
-                            item.get("ticker")
-                            and item.get("marketSector") in ["Equity", "Corp"]
-                            and item.get("exchCode") == "US"
-                        ):
-                            ticker = item["ticker"]
-                            logger.debug(f"Found ticker {ticker} for CUSIP {cusip}")
-                            return ticker
+                if data and len(data) > 0:
+                    ticker = self._ticker_from_result(data[0], "CUSIP")
+                    if ticker:
+                        logger.debug(f"Found ticker {ticker} for CUSIP {cusip}")
+                        return ticker
 
                 logger.debug(f"No ticker found for CUSIP {cusip}")
                 return None
@@ -509,22 +525,11 @@ class OpenFIGIClient:
                 data = response.json()
 
                 # Parse response to extract ticker
-                if data and len(data) > 0 and "data" in data[0]:
-                    for item in data[0]["data"]:
-                        # Look for equity instruments with ticker symbols
-                        if (
-                            item.get("ticker")
-                            and item.get("marketSector") in ["Equity", "Corp"]
-                            and item.get("securityType2")
-                            in [
-                                "Common Stock",
-                                "Equity",
-                            ]  # this my current filter from https://api.openfigi.com/v3/mapping/values/securityType2
-                            and item.get("exchCode") == "US"
-                        ):
-                            ticker = item["ticker"]
-                            logger.debug(f"Found ticker {ticker} for ISIN {isin}")
-                            return ticker
+                if data and len(data) > 0:
+                    ticker = self._ticker_from_result(data[0], "ISIN")
+                    if ticker:
+                        logger.debug(f"Found ticker {ticker} for ISIN {isin}")
+                        return ticker
 
                 logger.debug(f"No ticker found for ISIN {isin}")
                 return None
@@ -536,26 +541,176 @@ class OpenFIGIClient:
             logger.error(f"Unexpected error fetching ticker for ISIN {isin}: {e}")
             return None
 
+    @staticmethod
+    def _ticker_from_result(result: dict, id_type: str) -> Optional[str]:
+        """
+        Pick the ticker out of one OpenFIGI mapping job result.
+
+        Args:
+            result: One element of the /v3/mapping response array
+            id_type: 'CUSIP' or 'ISIN'
+
+        Returns:
+            Ticker symbol of the first matching US equity instrument, None otherwise
+        """
+        for item in result.get("data", []):
+            # Look for equity instruments with ticker symbols
+            if (
+                item.get("ticker")
+                and item.get("marketSector") in ["Equity", "Corp"]
+                and item.get("exchCode") == "US"
+                and (
+                    id_type != "ISIN"
+                    # this my current filter from https://api.openfigi.com/v3/mapping/values/securityType2
+                    or item.get("securityType2") in ["Common Stock", "Equity"]
+                )
+            ):
+                return item["ticker"]
+        return None
+
+    def _fetch_tickers_batch(
+        self, identifiers: List[str], id_type: str
+    ) -> Dict[str, Optional[str]]:
+        """
+        Fetch tickers for many identifiers with OpenFIGI bulk mapping jobs.
+
+        Sends up to max_jobs_per_request jobs per request; OpenFIGI returns one
+        result per job in request order.
+
+        Args:
+            identifiers: CUSIP or ISIN identifiers
+            id_type: 'CUSIP' or 'ISIN'
+
+        Returns:
+            Dictionary mapping identifier to ticker symbol (or None if not found).
+            Identifiers from failed requests are left out.
+        """
+        results = {}
+        chunks = [
+            identifiers[i : i + self.max_jobs_per_request]
+            for i in range(0, len(identifiers), self.max_jobs_per_request)
+        ]
+
+        for chunk in tqdm(chunks, desc=f"Fetching {id_type}s", leave=False):
+            payload = [
+                {
+                    "idType": f"ID_{id_type}",
+                    "idValue": identifier,
+                    "exchCode": "US",  # Focus on US exchanges
+                }
+                for identifier in chunk
+            ]
+
+            try:
+                response = self._make_request(self.mapping_url, payload)
+                if response.status_code != 200:
+                    continue
+
+                data = response.json()
+                if len(data) != len(chunk):
+                    logger.warning(
+                        f"Expected {len(chunk)} results from OpenFIGI, got {len(data)}"
+                    )
+                    continue
+
+                for identifier, result in zip(chunk, data):
+                    results[identifier] = self._ticker_from_result(result, id_type)
+
+            except requests.RequestException as e:
+                logger.error(f"API request failed for {len(chunk)} {id_type}s: {e}")
+            except Exception as e:
+                logger.error(f"Unexpected error fetching tickers for {len(chunk)} {id_type}s: {e}")
+
+        return results
+
+    def _get_multiple_tickers(
+        self, identifiers: List[str], id_type: str
+    ) -> Dict[str, Optional[str]]:
+        """
+        Resolve tickers for many identifiers: database cache, legacy cache, then API.
+
+        Args:
+            identifiers: CUSIP or ISIN identifiers
+            id_type: 'CUSIP' or 'ISIN'
+
+        Returns:
+            Dictionary mapping identifier to ticker symbol (or None if not found)
+        """
+        resolved = {}
+        to_lookup = []
+        for identifier in dict.fromkeys(identifiers):
+            if id_type == "CUSIP":
+                valid = isinstance(identifier, str) and len(identifier) == 9 and identifier != "000000000"
+            else:
+                valid = isinstance(identifier, str) and len(identifier) == 12
+            if valid:
+                to_lookup.append(identifier)
+            else:
+                logger.warning(f"Invalid {id_type} format: {identifier} (type: {type(identifier)})")
+                resolved[identifier] = None
+
+        # Try database cache first, in one query per batch of identifiers
+        if self.mapping_service and to_lookup:
+            mappings = self.mapping_service.get_active_tickers(id_type, to_lookup)
+            for identifier, mapping in mappings.items():
+                if mapping:
+                    resolved[identifier] = None if mapping.has_no_results else mapping.ticker
+            to_lookup = [identifier for identifier in to_lookup if identifier not in resolved]
+
+        # Fallback to legacy JSON cache
+        to_fetch = []
+        for identifier in to_lookup:
+            if identifier in self.cache:
+                resolved[identifier] = self.cache[identifier]
+            else:
+                to_fetch.append(identifier)
+
+        logger.debug(f"{len(to_fetch)}/{len(resolved) + len(to_fetch)} {id_type}s need API lookups")
+
+        # Make bulk API requests
+        fetched = self._fetch_tickers_batch(to_fetch, id_type) if to_fetch else {}
+        resolved.update(fetched)
+
+        # Cache results (including null results) in the database
+        if self.mapping_service and fetched:
+            pending = [
+                {
+                    "identifier_type": id_type,
+                    "identifier_value": identifier,
+                    "ticker": ticker,
+                    "has_no_results": ticker is None,
+                }
+                for identifier, ticker in fetched.items()
+            ]
+            for i in range(0, len(pending), self.cache_write_batch_size):
+                self.mapping_service.create_or_update_mappings(
+                    pending[i : i + self.cache_write_batch_size]
+                )
+
+        # Fallback to legacy cache
+        found = {identifier: ticker for identifier, ticker in fetched.items() if ticker is not None}
+        if found:
+            self.cache.update(found)
+            self._save_cache()
+
+        return {identifier: resolved.get(identifier) for identifier in identifiers}
+
     def get_multiple_tickers_from_cusips(
         self, cusips: List[str]
     ) -> Dict[str, Optional[str]]:
         """
         Get ticker symbols for multiple CUSIP identifiers.
 
+        Cache misses are fetched with bulk OpenFIGI requests rather than one
+        request per CUSIP.
+
         Args:
             cusips: List of CUSIP identifiers
 
         Returns:
             Dictionary mapping CUSIP to ticker symbol (or None if not found)
         """
-        results = {}
-
-        for _, cusip in tqdm(
-            enumerate(cusips), desc="Processing CUSIPs", total=len(cusips), leave=False
-        ):
-            results[cusip] = self.get_ticker_from_cusip(cusip)
-
-        return results
+        return self._get_multiple_tickers(cusips, "CUSIP")
 
     def get_multiple_tickers_from_isins(
         self, isins: List[str]
@@ -563,20 +718,16 @@ class OpenFIGIClient:
         """
         Get ticker symbols for multiple ISIN identifiers.
 
+        Cache misses are fetched with bulk OpenFIGI requests rather than one
+        request per ISIN.
+
         Args:
             isins: List of ISIN identifiers
 
         Returns:
             Dictionary mapping ISIN to ticker symbol (or None if not found)
         """
-        results = {}
-
-        for _, isin in tqdm(
-            enumerate(isins), desc="Processing ISINs", total=len(isins), leave=False
-        ):
-            results[isin] = self.get_ticker_from_isin(isin)
-
-        return results
+        return self._get_multiple_tickers(isins, "ISIN")
 
     def add_tickers_to_dataframe_by_cusip(
         self, df: pd.DataFrame, cusip_column: str = "cusip"
@@ -100,6 +100,37 @@ class R2Client:
             logger.error(f"Error uploading {key} to R2: {e}")
             return False
 
+    def _df_to_json(self, df: pd.DataFrame, metadata: Optional[Dict] = None) -> Dict:
+        """
+        Convert a holdings DataFrame to the JSON structure uploaded to R2.
+
+        Args:
+            df: pandas DataFrame with holdings data
+            metadata: Optional metadata to include in JSON
+
+        Returns:
+            Dictionary with "metadata" and "holdings" keys
+        """
+        # Categorical columns reject "" as a new category, so fill them as strings
+        category_columns = df.select_dtypes("category").columns
+        if len(category_columns):
+            df = df.astype({column: object for column in category_columns})
+
+        # Replace NaN values with empty strings
+        df = df.where(pd.notnull(df), "")
+
+        # Convert to records format (list of dictionaries)
+        holdings_data = df.to_dict("records")
+
+        return {
+            "metadata": {
+                "total_holdings": len(holdings_data),
+                "upload_timestamp": datetime.now().isoformat(),
+                **(metadata or {}),
+            },
+            "holdings": holdings_data,
+        }
+
     def read_csv_to_json(self, file_path: str) -> Optional[Dict]:
         """
         Read CSV file and convert to JSON format suitable for R2 upload.
@@ -118,32 +149,22 @@ class R2Client:
             # Read CSV file
             df = pd.read_csv(file_path)
 
-            # Replace NaN values with empty strings
-            df = df.where(pd.notnull(df), "")
-
-            # Convert DataFrame to JSON-friendly format
-            # Convert to records format (list of dictionaries)
-            holdings_data = df.to_dict("records")
-
             # Extract metadata from filename
             filename = os.path.basename(file_path)
             fund_ticker = self.extract_fund_ticker_from_filename(filename)
             timestamp = self.extract_timestamp_from_filename(filename)
 
-            # Create structured JSON data
-            json_data = {
-                "metadata": {
+            json_data = self._df_to_json(
+                df,
+                {
                     "fund_ticker": fund_ticker,
-                    "total_holdings": len(holdings_data),
                     "data_timestamp": timestamp,
                     "source_file": filename,
-                    "upload_timestamp": datetime.now().isoformat(),
                 },
-                "holdings": holdings_data,
-            }
+            )
 
             logger.info(
-                f"Converted CSV to JSON: {len(holdings_data)} holdings for {fund_ticker}"
+                f"Converted CSV to JSON: {json_data['metadata']['total_holdings']} holdings for {fund_ticker}"
             )
             return json_data
 
@@ -166,23 +187,7 @@ class R2Client:
             True if successful, False otherwise
         """
         try:
-            # Replace NaN values with empty strings
-            df = df.where(pd.notnull(df), "")
-
-            # Convert DataFrame to JSON-friendly format
-            holdings_data = df.to_dict("records")
-
-            # Create structured JSON data
-            json_data = {
-                "metadata": {
-                    "total_holdings": len(holdings_data),
-                    "upload_timestamp": datetime.now().isoformat(),
-                    **(metadata or {}),
-                },
-                "holdings": holdings_data,
-            }
-
-            return self.upload_json(json_data, key)
+            return self.upload_json(self._df_to_json(df, metadata), key)
 
         except Exception as e:
             logger.error(f"Error converting DataFrame to JSON for {key}: {e}")
@@ -42,6 +42,7 @@ class WorkflowPostgresConfig:
     
     # XML download and processing options
     enable_xml_download: bool = False  # Enable Stage 3: Download XML files
+    status_update_batch_size: int = 50  # Download statuses written per database batch
     enable_holdings_processing: bool = False  # Enable Stage 4: Extract holdings from XML
     enable_ticker_enrichment: bool = False  # Enable Stage 5: Enrich holdings with tickers
     
@@ -288,7 +289,8 @@ class FundHoldingsWorkflowPostgres:
 
                 logger.info(f"    │ Found {len(valid_filings)} valid {form_type} filings")
 
-                # Save filings to database
+                # Save filings to database in one batch
+                report_rows = []
                 for filing_data in valid_filings:
                     accession_number = filing_data.get("accession_number")
                     if not accession_number:
@@ -306,22 +308,25 @@ class FundHoldingsWorkflowPostgres:
                         "link_text": filing_data.get("link_text"),
                     }
 
-                    # Save to database
-                    report = self.sec_report_service.upsert_report(
-                        series_id=series_id,
-                        accession_number=accession_number,
-                        form_type=form_type,
-                        filing_date=filing_date,
-                        report_date=report_date,
-                        report_metadata=report_metadata,
-                        raw_data=filing_data,
+                    report_rows.append(
+                        {
+                            "series_id": series_id,
+                            "accession_number": accession_number,
+                            "form_type": form_type,
+                            "filing_date": filing_date,
+                            "report_date": report_date,
+                            "report_metadata": report_metadata,
+                            "raw_data": filing_data,
+                        }
                     )
 
-                    if report:
-                        filings_saved += 1
-                        logger.debug(f"      └─ Saved {form_type} filing {accession_number}")
+                if report_rows:
+                    saved = self.sec_report_service.upsert_reports(report_rows)
+                    if saved:
+                        filings_saved += saved
+                        logger.debug(f"      └─ Saved {saved} {form_type} filings")
                     else:
-                        logger.warning(f"      └─ Failed to save {form_type} filing {accession_number}")
+                        logger.warning(f"      └─ Failed to save {len(report_rows)} {form_type} filings")
 
                 # Apply filing limit if configured
                 if (self.config.max_filings_per_series and 
@@ -419,6 +424,24 @@ class FundHoldingsWorkflowPostgres:
             return 0
 
         downloaded_count = 0
+        # Status changes are written in batches rather than one commit per report
+        status_updates = []
+
+        def flush_status_updates() -> int:
+            """Write pending status changes; returns how many downloads were recorded."""
+            if not status_updates:
+                return 0
+            updated = self.sec_report_service.bulk_update_download_status(status_updates)
+            missed = len(status_updates) - updated
+            if missed:
+                logger.error(
+                    f"    │ Updated {updated} of {len(status_updates)} reports in the database; "
+                    f"{missed} failed or matched no report"
+                )
+            # Which updates missed is unknown, so count them against the downloads
+            queued = sum(1 for u in status_updates if u["status"] == "downloaded")
+            status_updates.clear()
+            return max(queued - missed, 0)
 
         for report in pending_reports:
             try:
@@ -445,30 +468,37 @@ class FundHoldingsWorkflowPostgres:
                     with open(xml_file_path, 'w', encoding='utf-8') as f:
                         f.write(xml_content)
                     
-                    # Update database with file path and download status
-                    file_paths = {"xml": xml_file_path}
-                    success = self.sec_report_service.update_download_status(
-                        report.id, "downloaded", file_paths=file_paths
+                    # Queue file path and download status for the database
+                    status_updates.append(
+                        {
+                            "report_id": report.id,
+                            "status": "downloaded",
+                            "file_paths": {"xml": xml_file_path},
+                        }
                     )
-                    
-                    if success:
-                        downloaded_count += 1
-                        logger.info(f"    │ Downloaded and saved: {xml_filename}")
-                    else:
-                        logger.error(f"    │ Failed to update database for {report.accession_number}")
+                    logger.info(f"    │ Downloaded and saved: {xml_filename}")
                 else:
                     # Mark as failed
-                    self.sec_report_service.update_download_status(
-                        report.id, "failed", error_message="Failed to download XML content"
+                    status_updates.append(
+                        {
+                            "report_id": report.id,
+                            "status": "failed",
+                            "error_message": "Failed to download XML content",
+                        }
                     )
                     logger.warning(f"    │ Failed to download XML for {report.accession_number}")
 
             except Exception as e:
                 logger.error(f"    │ Error downloading XML for {report.accession_number}: {e}")
-                self.sec_report_service.update_download_status(
-                    report.id, "failed", error_message=str(e)
+                status_updates.append(
+                    {"report_id": report.id, "status": "failed", "error_message": str(e)}
                 )
 
+            if len(status_updates) >= self.config.status_update_batch_size:
+                downloaded_count += flush_status_updates()
+
+        downloaded_count += flush_status_updates()
+
         logger.info(f"Downloaded {downloaded_count} XML files")
         return downloaded_count
 
@@ -542,15 +572,14 @@ class FundHoldingsWorkflowPostgres:
                     file_paths = report.file_paths or {}
                     file_paths["holdings_raw"] = csv_file_path
                     
-                    success = self.sec_report_service.update_download_status(
-                        report.id, "downloaded", file_paths=file_paths
+                    # Record the CSV path and processed status in one statement
+                    success = self.sec_report_service.update_statuses(
+                        report.id,
+                        download_status="downloaded",
+                        processing_status="processed",
+                        file_paths=file_paths,
                     )
                     
-                    if success:
-                        success = self.sec_report_service.update_processing_status(
-                            report.id, "processed"
-                        )
-                    
                     if success:
                         processed_count += 1
                         logger.info(f"    │ Processed {len(holdings_df)} holdings → {csv_filename}")
@@ -687,7 +716,7 @@ class FundHoldingsWorkflowPostgres:
                     select(FundSeries.issuer_id).where(
                         FundSeries.series_id == report.series_id,
                         FundSeries.is_current == True
-                    )
+                    ).limit(1)
                 ).first()
                 
                 if series:
@@ -798,7 +827,7 @@ class FundHoldingsWorkflowPostgres:
         # Look up each unique identifier in cache
         for identifier in unique_identifiers:
             try:
-                mapping = self.openfigi_client.mapping_service.get_active_mapping(id_type, identifier)
+                mapping = self.openfigi_client.mapping_service.get_active_ticker(id_type, identifier)
                 if mapping and not mapping.has_no_results:
                     # Update all rows with this identifier
                     identifier_mask = mask & (df[id_column] == identifier)
@@ -834,6 +863,8 @@ class FundHoldingsWorkflowPostgres:
             
         unique_identifiers = df.loc[mask, id_column].unique()
         api_hits = 0
+        mapping_service = self.openfigi_client.mapping_service
+        pending = []
         
         # Make API calls for each unique identifier
         for identifier in unique_identifiers:
@@ -850,13 +881,25 @@ class FundHoldingsWorkflowPostgres:
                     api_hits += identifier_mask.sum()
                 
                 # Cache the result (including null results)
-                if self.openfigi_client.mapping_service:
-                    self.openfigi_client.mapping_service.create_or_update_mapping(
-                        id_type, identifier, ticker, has_no_results=(ticker is None)
-                    )
+                pending.append(
+                    {
+                        "identifier_type": id_type,
+                        "identifier_value": identifier,
+                        "ticker": ticker,
+                        "has_no_results": ticker is None,
+                    }
+                )
                     
             except Exception as e:
                 logger.debug(f"API lookup error for {id_type} {identifier}: {e}")
+
+            # Write cached results one page at a time
+            if mapping_service and len(pending) >= self.openfigi_client.cache_write_batch_size:
+                mapping_service.create_or_update_mappings(pending)
+                pending = []
+
+        if mapping_service:
+            mapping_service.create_or_update_mappings(pending)
                 
         return api_hits
 
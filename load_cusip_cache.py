@@ -15,6 +15,7 @@ from loguru import logger
 
 from fh.config_utils import load_environment_config
 from fh.db_models import DatabaseManager, SecurityMappingService, SecurityMapping
+from sqlalchemy import update
 from sqlmodel import Session, select
 from datetime import datetime, timezone
 
@@ -130,36 +131,46 @@ def bulk_load_cusip_ticker_cache(cache_file_path: str, environment: str = "prod"
                     
                     # Query existing CUSIP mappings for this batch
                     if cusips_in_batch:
-                        cusip_stmt = select(SecurityMapping).where(
+                        cusip_stmt = select(
+                            SecurityMapping.id,
+                            SecurityMapping.identifier_value,
+                            SecurityMapping.identifier_type,
+                            SecurityMapping.ticker,
+                        ).where(
                             SecurityMapping.identifier_type == "CUSIP",
-                            SecurityMapping.identifier_value.in_(cusips_in_batch),
+                            db_manager.match_any(SecurityMapping.identifier_value, cusips_in_batch),
                             SecurityMapping.end_date.is_(None)  # Active mappings only
                         )
-                        for mapping in session.exec(cusip_stmt):
-                            existing_mappings[(mapping.identifier_value, mapping.identifier_type)] = mapping
+                        for mapping_id, identifier_value, id_type, ticker in session.exec(cusip_stmt):
+                            existing_mappings[(identifier_value, id_type)] = (mapping_id, ticker)
                     
                     # Query existing ISIN mappings for this batch
                     if isins_in_batch:
-                        isin_stmt = select(SecurityMapping).where(
+                        isin_stmt = select(
+                            SecurityMapping.id,
+                            SecurityMapping.identifier_value,
+                            SecurityMapping.identifier_type,
+                            SecurityMapping.ticker,
+                        ).where(
                             SecurityMapping.identifier_type == "ISIN",
-                            SecurityMapping.identifier_value.in_(isins_in_batch),
+                            db_manager.match_any(SecurityMapping.identifier_value, isins_in_batch),
                             SecurityMapping.end_date.is_(None)  # Active mappings only
                         )
-                        for mapping in session.exec(isin_stmt):
-                            existing_mappings[(mapping.identifier_value, mapping.identifier_type)] = mapping
+                        for mapping_id, identifier_value, id_type, ticker in session.exec(isin_stmt):
+                            existing_mappings[(identifier_value, id_type)] = (mapping_id, ticker)
                     
                     # Prepare objects for batch operations
                     new_mappings = []
-                    updated_mappings = []
+                    ended_mapping_ids = []
                     
                     for identifier, ticker, identifier_type in batch:
                         existing = existing_mappings.get((identifier, identifier_type))
                         
                         if existing:
-                            if existing.ticker != ticker:
+                            existing_id, existing_ticker = existing
+                            if existing_ticker != ticker:
                                 # Need to update - end the current mapping and create new one
-                                existing.end_date = datetime.now(timezone.utc)
-                                updated_mappings.append(existing)
+                                ended_mapping_ids.append(existing_id)
                                 
                                 # Create new mapping
                                 new_mapping = SecurityMapping(
@@ -167,10 +178,7 @@ def bulk_load_cusip_ticker_cache(cache_file_path: str, environment: str = "prod"
                                     identifier_value=identifier,
                                     ticker=ticker,
                                     has_no_results=False,
-                                    start_date=datetime.now(timezone.utc),
-                                    end_date=None,
-                                    created_at=datetime.now(timezone.utc),
-                                    updated_at=datetime.now(timezone.utc)
+                                    end_date=None
                                 )
                                 new_mappings.append(new_mapping)
                                 updated_count += 1
@@ -184,18 +192,18 @@ def bulk_load_cusip_ticker_cache(cache_file_path: str, environment: str = "prod"
                                 identifier_value=identifier,
                                 ticker=ticker,
                                 has_no_results=False,
-                                start_date=datetime.now(timezone.utc),
-                                end_date=None,
-                                created_at=datetime.now(timezone.utc),
-                                updated_at=datetime.now(timezone.utc)
+                                end_date=None
                             )
                             new_mappings.append(new_mapping)
                             loaded_count += 1
                     
-                    # Batch update existing mappings (end them)
-                    if updated_mappings:
-                        for mapping in updated_mappings:
-                            session.add(mapping)
+                    # Batch update existing mappings (end them) before inserting replacements
+                    if ended_mapping_ids:
+                        session.exec(
+                            update(SecurityMapping)
+                            .where(SecurityMapping.id.in_(ended_mapping_ids))
+                            .values(end_date=datetime.now(timezone.utc))
+                        )
                     
                     # Batch insert new mappings
                     if new_mappings:
@@ -204,7 +212,7 @@ def bulk_load_cusip_ticker_cache(cache_file_path: str, environment: str = "prod"
                     # Commit the batch
                     session.commit()
                     
-                    logger.debug(f"Batch {batch_num}: {len(new_mappings)} new, {len(updated_mappings)} updated")
+                    logger.debug(f"Batch {batch_num}: {len(new_mappings)} new, {len(ended_mapping_ids)} updated")
                     
             except Exception as e:
                 logger.error(f"Error processing batch {batch_num}: {e}")
@@ -6,13 +6,30 @@ This script parses N-PORT XML files and extracts both fund-level information
 and individual holdings data into pandas DataFrames.
 """
 
+import csv
 import os
-import xml.etree.ElementTree as ET
 from typing import Any, Dict, List, Optional
 
 import pandas as pd
+from lxml import etree as ET
 
-from fh.internal_schemas.holdings_schema import HoldingsRawDF, validate_holdings_raw
+from fh.internal_schemas.holdings_schema import (
+    HoldingsRawDF,
+    HoldingsRawSchema,
+    validate_holdings_raw,
+)
+
+# Column order of holdings_raw CSV files
+HOLDINGS_RAW_COLUMNS = list(HoldingsRawSchema.to_schema().columns)
+CSV_NUMERIC_COLUMNS = ("balance", "value_usd", "percent_value", "loan_value")
+CSV_REQUIRED_NUMERIC_COLUMNS = ("balance", "value_usd", "percent_value")
+# Large output buffer so a holdings CSV is flushed in a few big writes
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
+NPORT_NAMESPACE = "http://www.sec.gov/edgar/nport"
+# Clark-notation prefix for qualified N-PORT tag names
+NPORT_PREFIX = f"{{{NPORT_NAMESPACE}}}"
+INVST_OR_SEC_TAG = NPORT_PREFIX + "invstOrSec"
 
 
 class NPortParser:
@@ -23,8 +40,8 @@ class NPortParser:
         self.xml_file_path = xml_file_path
         self.root = None
         self.namespaces = {
-            "": "http://www.sec.gov/edgar/nport",
-            "nport": "http://www.sec.gov/edgar/nport",
+            "": NPORT_NAMESPACE,
+            "nport": NPORT_NAMESPACE,
             "com": "http://www.sec.gov/edgar/common",
             "ncom": "http://www.sec.gov/edgar/nportcommon",
         }
@@ -39,7 +56,7 @@ class NPortParser:
             print(f"Error loading XML file: {e}")
             return False
 
-    def get_text_safe(self, element: Optional[ET.Element], default: str = "") -> str:
+    def get_text_safe(self, element: Optional[ET._Element], default: str = "") -> str:
         """Safely get text from XML element"""
         if element is not None and element.text is not None:
             return element.text.strip()
@@ -139,102 +156,119 @@ class NPortParser:
             return holdings
 
         # Find all investment/security entries with proper namespace
-        invst_or_secs = self.root.findall(".//invstOrSec", self.namespaces)
-
-        for invst in invst_or_secs:
-            holding = {}
-
-            # Basic security information
-            holding["name"] = self.get_text_safe(invst.find("name", self.namespaces))
-            holding["lei"] = self.get_text_safe(invst.find("lei", self.namespaces))
-            holding["title"] = self.get_text_safe(invst.find("title", self.namespaces))
-            holding["cusip"] = self.get_text_safe(invst.find("cusip", self.namespaces))
+        for invst in self.root.iterfind(".//invstOrSec", self.namespaces):
+            holdings.append(self._holding_from_element(invst))
 
-            # Identifiers
-            isin_elem = invst.find(".//isin", self.namespaces)
-            if isin_elem is not None:
-                holding["isin"] = isin_elem.get("value", "")
-            else:
-                holding["isin"] = ""
-
-            # Other identifier
-            other_elem = invst.find(".//other", self.namespaces)
-            if other_elem is not None:
-                holding["other_id"] = other_elem.get("value", "")
-                holding["other_id_desc"] = other_elem.get("otherDesc", "")
-            else:
-                holding["other_id"] = ""
-                holding["other_id_desc"] = ""
-
-            # Financial data
-            holding["balance"] = self.get_text_safe(
-                invst.find("balance", self.namespaces)
-            )
-            holding["units"] = self.get_text_safe(invst.find("units", self.namespaces))
-            holding["currency"] = self.get_text_safe(
-                invst.find("curCd", self.namespaces)
-            )
-            holding["value_usd"] = self.get_text_safe(
-                invst.find("valUSD", self.namespaces)
-            )
-            holding["percent_value"] = self.get_text_safe(
-                invst.find("pctVal", self.namespaces)
-            )
+        return holdings
 
-            # Classification data
-            holding["payoff_profile"] = self.get_text_safe(
-                invst.find("payoffProfile", self.namespaces)
+    def _holding_from_element(self, invst: ET._Element) -> Dict[str, Any]:
+        """Extract one holding from an invstOrSec element"""
+        # Direct children by qualified tag; first occurrence wins, as with find()
+        children = {}
+        for child in invst:
+            children.setdefault(child.tag, child)
+
+        def text(tag: str) -> str:
+            return self.get_text_safe(children.get(NPORT_PREFIX + tag))
+
+        holding = {}
+
+        # Basic security information
+        holding["name"] = text("name")
+        holding["lei"] = text("lei")
+        holding["title"] = text("title")
+        holding["cusip"] = text("cusip")
+
+        # Identifiers
+        isin_elem = next(invst.iter(NPORT_PREFIX + "isin"), None)
+        if isin_elem is not None:
+            holding["isin"] = isin_elem.get("value", "")
+        else:
+            holding["isin"] = ""
+
+        # Other identifier
+        other_elem = next(invst.iter(NPORT_PREFIX + "other"), None)
+        if other_elem is not None:
+            holding["other_id"] = other_elem.get("value", "")
+            holding["other_id_desc"] = other_elem.get("otherDesc", "")
+        else:
+            holding["other_id"] = ""
+            holding["other_id_desc"] = ""
+
+        # Financial data
+        holding["balance"] = text("balance")
+        holding["units"] = text("units")
+        holding["currency"] = text("curCd")
+        holding["value_usd"] = text("valUSD")
+        holding["percent_value"] = text("pctVal")
+
+        # Classification data
+        holding["payoff_profile"] = text("payoffProfile")
+        holding["asset_category"] = text("assetCat")
+        holding["issuer_category"] = text("issuerCat")
+        holding["investment_country"] = text("invCountry")
+        holding["is_restricted_security"] = text("isRestrictedSec")
+        holding["fair_value_level"] = text("fairValLevel")
+
+        # Security lending information
+        sec_lending = children.get(NPORT_PREFIX + "securityLending")
+        if sec_lending is not None:
+            holding["is_cash_collateral"] = self.get_text_safe(
+                sec_lending.find(NPORT_PREFIX + "isCashCollateral")
             )
-            holding["asset_category"] = self.get_text_safe(
-                invst.find("assetCat", self.namespaces)
-            )
-            holding["issuer_category"] = self.get_text_safe(
-                invst.find("issuerCat", self.namespaces)
-            )
-            holding["investment_country"] = self.get_text_safe(
-                invst.find("invCountry", self.namespaces)
-            )
-            holding["is_restricted_security"] = self.get_text_safe(
-                invst.find("isRestrictedSec", self.namespaces)
-            )
-            holding["fair_value_level"] = self.get_text_safe(
-                invst.find("fairValLevel", self.namespaces)
+            holding["is_non_cash_collateral"] = self.get_text_safe(
+                sec_lending.find(NPORT_PREFIX + "isNonCashCollateral")
             )
 
-            # Security lending information
-            sec_lending = invst.find("securityLending", self.namespaces)
-            if sec_lending is not None:
-                holding["is_cash_collateral"] = self.get_text_safe(
-                    sec_lending.find("isCashCollateral", self.namespaces)
-                )
-                holding["is_non_cash_collateral"] = self.get_text_safe(
-                    sec_lending.find("isNonCashCollateral", self.namespaces)
-                )
-
-                loan_by_fund = sec_lending.find("loanByFundCondition", self.namespaces)
-                if loan_by_fund is not None:
-                    holding["is_loan_by_fund"] = loan_by_fund.get("isLoanByFund", "")
-                    holding["loan_value"] = loan_by_fund.get("loanVal", "")
-                else:
-                    holding["is_loan_by_fund"] = ""
-                    holding["loan_value"] = ""
+            loan_by_fund = sec_lending.find(NPORT_PREFIX + "loanByFundCondition")
+            if loan_by_fund is not None:
+                holding["is_loan_by_fund"] = loan_by_fund.get("isLoanByFund", "")
+                holding["loan_value"] = loan_by_fund.get("loanVal", "")
             else:
-                holding["is_cash_collateral"] = ""
-                holding["is_non_cash_collateral"] = ""
                 holding["is_loan_by_fund"] = ""
                 holding["loan_value"] = ""
+        else:
+            holding["is_cash_collateral"] = ""
+            holding["is_non_cash_collateral"] = ""
+            holding["is_loan_by_fund"] = ""
+            holding["loan_value"] = ""
+
+        return holding
+
+    def _stream_holdings_data(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Parse the XML file once, extracting holdings as they are read.
+
+        Each invstOrSec element is discarded once extracted, so memory is
+        bounded by the fund-level part of the document. That part stays on
+        self.root for get_fund_info.
+        """
+        try:
+            holdings = []
+            context = ET.iterparse(
+                self.xml_file_path, events=("end",), tag=INVST_OR_SEC_TAG
+            )
+            for _, invst in context:
+                holdings.append(self._holding_from_element(invst))
 
-            holdings.append(holding)
+                # Free the processed holding and any earlier siblings
+                invst.clear(keep_tail=True)
+                while invst.getprevious() is not None:
+                    del invst.getparent()[0]
 
-        return holdings
+            self.root = context.root
+            return holdings
+        except Exception as e:
+            print(f"Error loading XML file: {e}")
+            return None
 
     def to_dataframes(self) -> tuple[HoldingsRawDF, Dict[str, Any]]:
         """Parse XML and return holdings DataFrame and fund info dict"""
-        if not self.load_xml():
+        holdings_data = self._stream_holdings_data()
+        if holdings_data is None:
             return pd.DataFrame(), {}
 
         fund_info = self.get_fund_info()
-        holdings_data = self.get_holdings_data()
 
         # Convert holdings to DataFrame
         holdings_df = pd.DataFrame(holdings_data)
@@ -244,19 +278,100 @@ class NPortParser:
             holdings_df["source_file"] = os.path.basename(self.xml_file_path)
             holdings_df["report_period_date"] = fund_info.get("report_period_date", "")
 
-        # Convert numeric columns
+        # Convert numeric columns (same parsing as to_csv, so both agree)
         numeric_columns = ["balance", "value_usd", "loan_value"]
         for col in numeric_columns:
             if col in holdings_df.columns:
-                holdings_df[col] = pd.to_numeric(holdings_df[col], errors="coerce")
+                holdings_df[col] = [_parse_number(value) for value in holdings_df[col]]
 
         # Convert percent_value from percentage to decimal (divide by 100)
         if "percent_value" in holdings_df.columns:
-            holdings_df["percent_value"] = (
-                pd.to_numeric(holdings_df["percent_value"], errors="coerce") / 100
+            holdings_df["percent_value"] = [
+                _parse_number(value) / 100 for value in holdings_df["percent_value"]
+            ]
+
+        self._convert_fund_info_numbers(fund_info)
+
+        # Validate holdings DataFrame against schema
+        if not holdings_df.empty:
+            holdings_df = validate_holdings_raw(holdings_df)
+
+        return holdings_df, fund_info
+
+    def to_csv(self, csv_file_path: str) -> tuple[int, Dict[str, Any]]:
+        """
+        Parse XML and write holdings straight to CSV, without a DataFrame.
+
+        Applies the same conversions as to_dataframes and writes the same
+        columns and number formatting. No file is created when there are no
+        holdings, and a partially written file is removed if parsing fails.
+
+        Args:
+            csv_file_path: Path of the CSV file to write
+
+        Returns:
+            tuple: (number of holdings written, fund_info dict)
+
+        Raises:
+            ValueError: If a holding is missing a required numeric value
+        """
+        source_file = os.path.basename(self.xml_file_path)
+        report_period_date = None
+        holdings_count = 0
+        csv_file = None
+
+        try:
+            context = ET.iterparse(
+                self.xml_file_path, events=("end",), tag=INVST_OR_SEC_TAG
             )
+            for _, invst in context:
+                if csv_file is None:
+                    # genInfo precedes the holdings, so it is already parsed
+                    self.root = invst.getroottree().getroot()
+                    report_period_date = self.get_fund_info().get(
+                        "report_period_date", ""
+                    )
+                    csv_file = open(
+                        csv_file_path, "w", newline="", buffering=CSV_WRITE_BUFFER_SIZE
+                    )
+                    writer = csv.writer(csv_file, lineterminator="\n")
+                    writer.writerow(HOLDINGS_RAW_COLUMNS)
+
+                holding = self._holding_from_element(invst)
+                holding["source_file"] = source_file
+                holding["report_period_date"] = report_period_date
+                for col in CSV_NUMERIC_COLUMNS:
+                    holding[col] = _csv_number(holding[col], col == "percent_value")
+                for col in CSV_REQUIRED_NUMERIC_COLUMNS:
+                    if not holding[col]:
+                        raise ValueError(f"Holding {holding['name']!r} has no {col}")
+                writer.writerow([holding[col] for col in HOLDINGS_RAW_COLUMNS])
+                holdings_count += 1
+
+                # Free the processed holding and any earlier siblings
+                invst.clear(keep_tail=True)
+                while invst.getprevious() is not None:
+                    del invst.getparent()[0]
+
+            self.root = context.root
+        except Exception as e:
+            if csv_file is not None:
+                csv_file.close()
+                os.remove(csv_file_path)
+            if isinstance(e, (OSError, ET.XMLSyntaxError)):
+                print(f"Error loading XML file: {e}")
+                return 0, {}
+            raise
+
+        if csv_file is not None:
+            csv_file.close()
+
+        fund_info = self.get_fund_info()
+        self._convert_fund_info_numbers(fund_info)
+        return holdings_count, fund_info
 
-        # Convert fund info numeric columns
+    def _convert_fund_info_numbers(self, fund_info: Dict[str, Any]) -> None:
+        """Convert fund info numeric columns in place"""
         fund_numeric_columns = ["total_assets", "total_liabilities", "net_assets"]
         for col in fund_numeric_columns:
             if col in fund_info:
@@ -265,11 +380,28 @@ class NPortParser:
                 except (ValueError, TypeError):
                     fund_info[col] = None
 
-        # Validate holdings DataFrame against schema
-        if not holdings_df.empty:
-            holdings_df = validate_holdings_raw(holdings_df)
 
-        return holdings_df, fund_info
+def _parse_number(value: Optional[str]) -> float:
+    """Parse a numeric XML value, returning NaN if it is missing or unparseable."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _csv_number(value: str, is_percent: bool = False) -> str:
+    """
+    Format a numeric XML value the way pandas writes a float64 CSV column.
+
+    Unparseable or empty values become an empty field, like NaN.
+    """
+    number = _parse_number(value)
+    if number != number:  # NaN
+        return ""
+    if is_percent:
+        # Convert percent_value from percentage to decimal
+        number /= 100
+    return repr(number)
 
 
 def parse_nport_file(xml_file_path: str) -> tuple[HoldingsRawDF, Dict[str, Any]]:
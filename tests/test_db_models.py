@@ -0,0 +1,495 @@
+"""
+Tests for the fund data SCD upserts, security mapping bulk import and
+report upserts against a SQLite database.
+
+Tests marked integration run against the PostgreSQL database in
+TEST_DATABASE_URL and are skipped when it is not set. They create any
+missing tables and delete only the rows they insert.
+"""
+
+import os
+from datetime import datetime, timezone
+
+import pytest
+from sqlmodel import SQLModel, delete, insert, select, update
+
+from fh.db_models import (
+    SET_BASED_SCD_MIN_ROWS,
+    DatabaseManager,
+    FundClass,
+    FundDataSCDService,
+    FundIssuer,
+    FundProvider,
+    FundSeries,
+    SECReport,
+    SECReportService,
+    SecurityMapping,
+    SecurityMappingService,
+)
+
+EFFECTIVE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+NOW = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+# upsert_series_data stamps rows with naive datetime.now(); newer sqlmodel
+# releases than the locked one map datetime fields to a type that rejects them
+requires_naive_datetimes = pytest.mark.skipif(
+    type(FundClass.__table__.c.effective_date.type).__name__ == "UTCDateTime",
+    reason="installed sqlmodel rejects naive datetimes",
+)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """DatabaseManager backed by a fresh SQLite file."""
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'fh.db'}")
+    SQLModel.metadata.create_all(manager.engine)
+    return manager
+
+
+@pytest.fixture
+def pg_manager():
+    """DatabaseManager for the PostgreSQL database in TEST_DATABASE_URL."""
+    database_url = os.getenv("TEST_DATABASE_URL")
+    if not database_url:
+        pytest.skip("TEST_DATABASE_URL not set")
+    manager = DatabaseManager(database_url)
+    SQLModel.metadata.create_all(manager.engine)
+    yield manager
+    manager.engine.dispose()
+
+
+def add_class(session, class_id, class_name, ticker, class_num=None):
+    session.add(
+        FundClass(
+            series_id="S000004310",
+            class_id=class_id,
+            class_num=class_num,
+            class_name=class_name,
+            ticker=ticker,
+            is_current=True,
+            effective_date=EFFECTIVE,
+            last_verified_date=EFFECTIVE,
+            created_at=EFFECTIVE,
+            updated_at=EFFECTIVE,
+        )
+    )
+
+
+def class_row(class_id, class_name, ticker, series_id="S000004310"):
+    return {
+        "series_id": series_id,
+        "class_id": class_id,
+        "class_name": class_name,
+        "ticker": ticker,
+    }
+
+
+def test_end_changed_classes_ends_only_changed_rows(db_manager):
+    """Changed series/name/ticker rows are ended, including rows without class_num"""
+    with db_manager.get_session() as session:
+        add_class(session, "C000000001", "Class A", "AAA", class_num=1)
+        add_class(session, "C000000002", "Class B", "BBB", class_num=2)
+        # Written before class_num existed
+        add_class(session, "C000000003", "Class C", "CCC")
+        add_class(session, "C000000004", "Class D", "DDD", class_num=4)
+        session.commit()
+
+    class_rows = {
+        "C000000001": class_row("C000000001", "Class A", "AAA"),
+        "C000000002": class_row("C000000002", "Class B", "BBX"),
+        "C000000003": class_row("C000000003", "Class C Renamed", "CCC"),
+        # Same name and ticker under another series
+        "C000000004": class_row("C000000004", "Class D", "DDD", series_id="S000004311"),
+    }
+
+    service = FundDataSCDService(db_manager)
+    with db_manager.get_session() as session:
+        ended = service._end_changed_classes(session, class_rows, list(class_rows), NOW)
+        session.commit()
+
+    assert sorted(ended) == [
+        ("C000000002", "S000004310", "Class B", "BBB"),
+        ("C000000003", "S000004310", "Class C", "CCC"),
+        ("C000000004", "S000004310", "Class D", "DDD"),
+    ]
+
+    with db_manager.get_session() as session:
+        current = session.exec(
+            select(FundClass.class_id).where(FundClass.is_current == True)
+        ).all()
+    assert current == ["C000000001"]
+
+
+def test_end_changed_classes_ignores_unknown_ids(db_manager):
+    """Ids with no current row are left for the insert path"""
+    service = FundDataSCDService(db_manager)
+    class_rows = {"C000000009": class_row("C000000009", "New", None)}
+
+    with db_manager.get_session() as session:
+        assert (
+            service._end_changed_classes(session, class_rows, list(class_rows), NOW)
+            == []
+        )
+
+
+def series(classes, series_id="S000004310"):
+    return {"series_id": series_id, "classes": classes}
+
+
+def sec_class(class_id, class_name, ticker):
+    return {"class_id": class_id, "class_name": class_name, "ticker": ticker}
+
+
+@requires_naive_datetimes
+def test_upsert_series_data_inserts_verifies_and_versions(db_manager):
+    """New rows are inserted, repeats verified and changed classes versioned"""
+    service = FundDataSCDService(db_manager)
+    series_data = [
+        series(
+            [
+                sec_class("C000219740", "Class A", "AAA"),
+                sec_class("C000219741", "Class B", "BBB"),
+                {"class_id": "not-a-class"},
+            ]
+        ),
+        series([], series_id="X1"),
+    ]
+
+    stats = service.upsert_series_data(1, series_data)
+    assert stats == {
+        "series_new": 1,
+        "series_verified": 0,
+        "series_skipped_invalid": 1,
+        "classes_new": 2,
+        "classes_updated": 0,
+        "classes_verified": 0,
+        "classes_skipped_invalid": 1,
+    }
+
+    stats = service.upsert_series_data(1, series_data)
+    assert (stats["series_new"], stats["series_verified"]) == (0, 1)
+    assert (
+        stats["classes_new"],
+        stats["classes_verified"],
+        stats["classes_updated"],
+    ) == (0, 2, 0)
+
+    series_data[0]["classes"][0]["ticker"] = "AAX"
+    stats = service.upsert_series_data(1, series_data)
+    assert (
+        stats["classes_new"],
+        stats["classes_verified"],
+        stats["classes_updated"],
+    ) == (0, 1, 1)
+
+    with db_manager.get_session() as session:
+        history = session.exec(
+            select(
+                FundClass.class_id,
+                FundClass.ticker,
+                FundClass.is_current,
+                FundClass.change_reason,
+            )
+            .where(FundClass.class_id == "C000219740")
+            .order_by(FundClass.id)
+        ).all()
+    assert history == [
+        ("C000219740", "AAA", False, "new_record"),
+        ("C000219740", "AAX", True, "ticker: 'AAA' → 'AAX'"),
+    ]
+
+    # Class B moves to another series under the same name and ticker
+    series_data.append(
+        series([series_data[0]["classes"].pop(1)], series_id="S000004311")
+    )
+    stats = service.upsert_series_data(1, series_data)
+    assert (stats["series_new"], stats["series_verified"]) == (1, 1)
+    assert (
+        stats["classes_new"],
+        stats["classes_verified"],
+        stats["classes_updated"],
+    ) == (0, 1, 1)
+
+    with db_manager.get_session() as session:
+        history = session.exec(
+            select(FundClass.series_id, FundClass.is_current, FundClass.change_reason)
+            .where(FundClass.class_id == "C000219741")
+            .order_by(FundClass.id)
+        ).all()
+    assert history == [
+        ("S000004310", False, "new_record"),
+        ("S000004311", True, "series: 'S000004310' → 'S000004311'"),
+    ]
+
+
+@pytest.mark.integration
+@requires_naive_datetimes
+def test_upsert_series_data_set_based_scd_postgres(pg_manager):
+    """Large change sets go through the UPDATE ... FROM (VALUES ...) path"""
+    class_count = SET_BASED_SCD_MIN_ROWS + 20
+    class_ids = [f"C99{i:08d}" for i in range(class_count)]
+    series_id = "S999999999"
+
+    def load(ticker_prefix, changed):
+        return [
+            series(
+                [
+                    sec_class(
+                        class_id,
+                        f"Class {i}",
+                        f"{ticker_prefix}{i}" if i < changed else f"T{i}",
+                    )
+                    for i, class_id in enumerate(class_ids)
+                ],
+                series_id=series_id,
+            )
+        ]
+
+    with pg_manager.get_session() as session:
+        provider_id = session.exec(
+            insert(FundProvider)
+            .values(provider_name="test-scd-provider", is_active=True)
+            .returning(FundProvider.id)
+        ).scalar_one()
+        issuer_id = session.exec(
+            insert(FundIssuer)
+            .values(
+                provider_id=provider_id,
+                cik="9999999901",
+                company_name="Test SCD Issuer",
+                is_active=True,
+            )
+            .returning(FundIssuer.id)
+        ).scalar_one()
+        session.commit()
+
+    service = FundDataSCDService(pg_manager)
+    try:
+        stats = service.upsert_series_data(issuer_id, load("T", 0))
+        assert stats["classes_new"] == class_count
+
+        # Enough changed classes to take the set-based path
+        changed = SET_BASED_SCD_MIN_ROWS + 5
+        stats = service.upsert_series_data(issuer_id, load("N", changed))
+        assert stats["classes_updated"] == changed
+        assert stats["classes_verified"] == class_count - changed
+
+        with pg_manager.get_session() as session:
+            rows = session.exec(
+                select(FundClass.ticker, FundClass.is_current, FundClass.change_reason)
+                .where(FundClass.class_id == class_ids[0])
+                .order_by(FundClass.id)
+            ).all()
+            current_count = session.exec(
+                select(FundClass.id).where(
+                    FundClass.series_id == series_id, FundClass.is_current == True
+                )
+            ).all()
+        assert rows == [
+            ("T0", False, "new_record"),
+            ("N0", True, "ticker: 'T0' → 'N0'"),
+        ]
+        assert len(current_count) == class_count
+    finally:
+        with pg_manager.get_session() as session:
+            session.exec(delete(FundClass).where(FundClass.series_id == series_id))
+            session.exec(delete(FundSeries).where(FundSeries.issuer_id == issuer_id))
+            session.exec(delete(FundIssuer).where(FundIssuer.id == issuer_id))
+            session.exec(delete(FundProvider).where(FundProvider.id == provider_id))
+            session.commit()
+
+
+def mapping(identifier_value, ticker, identifier_type="CUSIP", has_no_results=False):
+    return {
+        "identifier_type": identifier_type,
+        "identifier_value": identifier_value,
+        "ticker": ticker,
+        "has_no_results": has_no_results,
+    }
+
+
+def active_mappings(db_manager, identifier_values):
+    with db_manager.get_session() as session:
+        return session.exec(
+            select(
+                SecurityMapping.identifier_value,
+                SecurityMapping.ticker,
+                SecurityMapping.has_no_results,
+            )
+            .where(
+                SecurityMapping.identifier_value.in_(identifier_values),
+                SecurityMapping.end_date.is_(None),
+            )
+            .order_by(SecurityMapping.identifier_value)
+        ).all()
+
+
+def check_bulk_import(db_manager, identifier_values):
+    first, second, third = identifier_values
+    service = SecurityMappingService(db_manager)
+    assert service.create_or_update_mapping("CUSIP", first, "AAPL") is not None
+    # Cached miss that the import should replace
+    assert service.get_active_ticker("CUSIP", second) is None
+
+    inserted = service.bulk_import(
+        mapping(value, ticker, has_no_results=ticker is None)
+        for value, ticker in [
+            (first, "CHANGED"),
+            (second, "MSFT"),
+            (second, "DUPLICATE"),
+            (third, None),
+        ]
+    )
+
+    assert inserted == 2
+    assert active_mappings(db_manager, identifier_values) == [
+        (first, "AAPL", False),
+        (second, "MSFT", False),
+        (third, None, True),
+    ]
+    assert service.get_active_ticker("CUSIP", second).ticker == "MSFT"
+
+
+def test_bulk_import_skips_existing_mappings(db_manager):
+    """Existing and repeated identifiers are skipped; NULL tickers survive"""
+    check_bulk_import(db_manager, ["037833100", "594918104", "931142103"])
+
+
+@pytest.mark.integration
+def test_bulk_import_copy_postgres(pg_manager):
+    """The COPY + INSERT ... SELECT path behaves like the batched inserts"""
+    identifier_values = ["TESTBULK1", "TESTBULK2", "TESTBULK3"]
+    try:
+        check_bulk_import(pg_manager, identifier_values)
+    finally:
+        with pg_manager.get_session() as session:
+            session.exec(
+                delete(SecurityMapping).where(
+                    SecurityMapping.identifier_value.in_(identifier_values)
+                )
+            )
+            session.commit()
+
+
+def test_clear_cache_chunked_ends_every_mapping(db_manager):
+    """Mappings are ended over several chunks and stamped with updated_at"""
+    service = SecurityMappingService(db_manager)
+    values = [f"{i:09d}" for i in range(25)]
+    assert service.bulk_import(mapping(value, "X") for value in values) == 25
+    with db_manager.get_session() as session:
+        session.exec(update(SecurityMapping).values(updated_at=EFFECTIVE))
+        session.commit()
+
+    assert service.clear_cache_chunked(chunk_size=10) == 25
+
+    assert active_mappings(db_manager, values) == []
+    with db_manager.get_session() as session:
+        stale = session.exec(
+            select(SecurityMapping.id).where(SecurityMapping.updated_at == EFFECTIVE)
+        ).all()
+    assert stale == []
+
+
+def test_upsert_report_keeps_payloads_unless_replaced(db_manager):
+    """New reports store {}; later upserts without payloads keep stored ones"""
+    service = SECReportService(db_manager)
+
+    report = service.upsert_report("S000004310", "0000000000-24-000001", "NPORT-P")
+    assert (report.report_metadata, report.raw_data) == ({}, {})
+
+    report = service.upsert_report(
+        "S000004310",
+        "0000000000-24-000001",
+        "NPORT-P",
+        report_metadata={"pages": 1},
+        raw_data={"holdings": 2},
+    )
+    assert (report.report_metadata, report.raw_data) == ({"pages": 1}, {"holdings": 2})
+
+    report = service.upsert_report("S000004310", "0000000000-24-000001", "NPORT-P")
+    assert (report.report_metadata, report.raw_data) == ({"pages": 1}, {"holdings": 2})
+
+    assert (
+        service.upsert_reports(
+            [
+                {
+                    "series_id": "S000004310",
+                    "accession_number": "0000000000-24-000001",
+                    "form_type": "NPORT-P",
+                    "raw_data": {"holdings": 3},
+                }
+            ]
+        )
+        == 1
+    )
+    report = service.upsert_report("S000004310", "0000000000-24-000001", "NPORT-P")
+    assert (report.report_metadata, report.raw_data) == ({"pages": 1}, {"holdings": 3})
+
+
+@requires_naive_datetimes
+def test_iter_stale_identifiers_pages_by_key(db_manager):
+    """Stale identifiers are yielded once each with no connection held between pages"""
+    service = SecurityMappingService(db_manager)
+    cusips = [f"{i:09d}" for i in range(25)]
+    isins = [f"US{i:010d}" for i in range(5)]
+    service.bulk_import(
+        [mapping(value, "X") for value in cusips]
+        + [mapping(value, "Y", identifier_type="ISIN") for value in isins]
+        + [mapping("FRESH0000", "Z")]
+    )
+    with db_manager.get_session() as session:
+        session.exec(
+            update(SecurityMapping)
+            .where(SecurityMapping.identifier_value != "FRESH0000")
+            .values(last_fetched_date=EFFECTIVE)
+        )
+        session.commit()
+
+    seen = []
+    for identifier_type, identifier_value in service.iter_stale_identifiers(
+        max_age_days=30, batch_size=10
+    ):
+        seen.append((identifier_type, identifier_value))
+        # No connection is held while the caller works through a page
+        assert db_manager.engine.pool.checkedout() == 0
+        # Refreshing rows mid-iteration must not skip or repeat the rest
+        service.create_or_update_mapping(identifier_type, identifier_value, "NEW")
+
+    assert seen == [("CUSIP", value) for value in cusips] + [
+        ("ISIN", value) for value in isins
+    ]
+
+
+def test_bulk_update_download_status_counts_matched_reports(db_manager):
+    """Only updates that matched a report are counted"""
+    service = SECReportService(db_manager)
+    first = service.upsert_report("S000004310", "0000000000-24-000001", "NPORT-P")
+    second = service.upsert_report("S000004310", "0000000000-24-000002", "NPORT-P")
+
+    updated = service.bulk_update_download_status(
+        [
+            {
+                "report_id": first.id,
+                "status": "downloaded",
+                "file_paths": {"xml": "a.xml"},
+            },
+            {"report_id": second.id, "status": "failed", "error_message": "HTTP 404"},
+            {
+                "report_id": 999_999,
+                "status": "downloaded",
+                "file_paths": {"xml": "b.xml"},
+            },
+        ]
+    )
+
+    assert updated == 2
+    with db_manager.get_session() as session:
+        rows = session.exec(
+            select(
+                SECReport.download_status, SECReport.file_paths, SECReport.error_message
+            ).order_by(SECReport.id)
+        ).all()
+    assert rows == [
+        ("downloaded", {"xml": "a.xml"}, None),
+        ("failed", None, "HTTP 404"),
+    ]
@@ -0,0 +1,73 @@
+"""
+Tests that the streaming CSV writer matches the DataFrame path of NPortParser.
+"""
+
+from pathlib import Path
+
+import pandera.errors
+import pytest
+
+from parse_nport import NPortParser
+
+FIXTURES = Path(__file__).parent / "fixtures" / "nport"
+
+
+@pytest.mark.parametrize("fixture", ["nport_holdings.xml", "nport_number_formats.xml"])
+def test_to_csv_matches_dataframe_csv(tmp_path, fixture):
+    """to_csv writes the same bytes as to_dataframes().to_csv"""
+    xml_path = str(FIXTURES / fixture)
+
+    holdings_df, fund_info = NPortParser(xml_path).to_dataframes()
+    holdings_df.to_csv(tmp_path / "dataframe.csv", index=False)
+
+    count, streamed_fund_info = NPortParser(xml_path).to_csv(
+        str(tmp_path / "streamed.csv")
+    )
+
+    assert count == len(holdings_df) > 0
+    assert streamed_fund_info == fund_info
+    assert (tmp_path / "streamed.csv").read_bytes() == (
+        tmp_path / "dataframe.csv"
+    ).read_bytes()
+
+
+def test_to_csv_without_holdings_writes_nothing(tmp_path):
+    """A filing with no holdings returns fund info but creates no file"""
+    xml_path = str(FIXTURES / "nport_no_holdings.xml")
+    csv_path = tmp_path / "holdings.csv"
+
+    holdings_df, fund_info = NPortParser(xml_path).to_dataframes()
+    count, streamed_fund_info = NPortParser(xml_path).to_csv(str(csv_path))
+
+    assert holdings_df.empty
+    assert count == 0
+    assert streamed_fund_info == fund_info
+    assert fund_info["report_period_date"] == "2024-01-31"
+    assert not csv_path.exists()
+
+
+def test_to_csv_rejects_missing_required_number(tmp_path):
+    """Both paths reject a holding without value_usd; no partial CSV is left"""
+    xml_path = str(FIXTURES / "nport_missing_value.xml")
+    csv_path = tmp_path / "holdings.csv"
+
+    with pytest.raises(pandera.errors.SchemaError):
+        NPortParser(xml_path).to_dataframes()
+
+    with pytest.raises(ValueError, match="value_usd"):
+        NPortParser(xml_path).to_csv(str(csv_path))
+
+    assert not csv_path.exists()
+
+
+def test_to_csv_malformed_xml(tmp_path):
+    """Truncated XML yields no holdings and no file from either path"""
+    xml_path = str(FIXTURES / "nport_malformed.xml")
+    csv_path = tmp_path / "holdings.csv"
+
+    holdings_df, fund_info = NPortParser(xml_path).to_dataframes()
+    assert holdings_df.empty
+    assert fund_info == {}
+
+    assert NPortParser(xml_path).to_csv(str(csv_path)) == (0, {})
+    assert not csv_path.exists()